@@ -0,0 +1,56 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled emission batch kernel, used by environmental_impact when numba is missing
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+cimport openmp
+from cython cimport floating
+from cython.parallel cimport prange
+
+def get_num_threads():
+    """OpenMP threads emission_batch currently uses"""
+    return openmp.omp_get_max_threads()
+
+def set_num_threads(int n_threads):
+    """Limit the OpenMP threads used by emission_batch"""
+    openmp.omp_set_num_threads(n_threads)
+
+# Weather buckets count the thresholds a value is below, so NaN lands in the
+# last bucket exactly as in environmental_impact._humidity_bucket and friends
+cdef inline Py_ssize_t _humidity_bucket(double humidity) noexcept nogil:
+    return 3 - (humidity < 30.0) - (humidity < 50.0) - (humidity < 70.0)
+
+cdef inline Py_ssize_t _wind_bucket(double wind_speed) noexcept nogil:
+    return 2 - (wind_speed < 10.0) - (wind_speed < 25.0)
+
+cdef inline Py_ssize_t _temperature_bucket(double temperature) noexcept nogil:
+    return 2 - (temperature < 20.0) - (temperature < 35.0)
+
+def emission_batch(const floating[::1] area_ha, const Py_ssize_t[::1] veg_code,
+                   const Py_ssize_t[::1] intensity_code, const double[::1] humidity,
+                   const double[::1] wind_speed, const double[::1] temperature,
+                   const floating[::1] veg_combined, const floating[::1] biomass_per_ha,
+                   const floating[::1] emission_factors, const floating[::1] combustion_eff,
+                   const floating[::1] hum_table, const floating[::1] wind_table,
+                   const floating[::1] temp_table, double co2e_mul, floating[:, ::1] out):
+    """Fill out (n x len(EMISSION_FIELDS)) with per-fire emissions, fires split across OpenMP threads"""
+    cdef Py_ssize_t i, veg, intensity
+    cdef floating burned, co2_kg
+
+    for i in prange(area_ha.shape[0], nogil=True, schedule='static'):
+        veg = veg_code[i]
+        intensity = intensity_code[i]
+        burned = (area_ha[i] * combustion_eff[intensity]
+                  * hum_table[_humidity_bucket(humidity[i])]
+                  * wind_table[_wind_bucket(wind_speed[i])]
+                  * temp_table[_temperature_bucket(temperature[i])])
+        co2_kg = burned * veg_combined[veg]
+        out[i, 0] = co2_kg
+        out[i, 1] = co2_kg / 1000
+        out[i, 2] = co2_kg * 0.005
+        out[i, 3] = co2_kg * 0.001
+        out[i, 4] = co2_kg * co2e_mul
+        out[i, 5] = burned * biomass_per_ha[veg]
+        out[i, 6] = emission_factors[veg]
+        out[i, 7] = combustion_eff[intensity]
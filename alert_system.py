@@ -1,24 +1,74 @@
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
+from json_provider import install_json_provider, dumps_bytes
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 from datetime import datetime, timedelta
-from threading import Thread
+from threading import Thread, BoundedSemaphore, Condition, RLock
+from concurrent.futures import ThreadPoolExecutor, wait
 import time
+import queue
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import os
+from types import MappingProxyType
+import hashlib
+import importlib.util
+from collections import deque
+from itertools import islice
 
-# Twilio integration (you'll need to install twilio: pip install twilio)
-try:
-    from twilio.rest import Client
-    TWILIO_AVAILABLE = True
-except ImportError:
-    TWILIO_AVAILABLE = False
+# Twilio integration (you'll need to install twilio: pip install twilio).
+# Only probe for the package here; it is imported when real credentials are configured.
+TWILIO_AVAILABLE = importlib.util.find_spec('twilio') is not None
+if not TWILIO_AVAILABLE:
     print("Warning: Twilio not installed. SMS alerts will be simulated.")
 
-@dataclass
+# Central emergency coordination number, copied on every alert
+CENTRAL_EMERGENCY_NUMBER = '+919876543200'
+
+# Region coordinates (simplified mapping)
+_REGION_COORDS = MappingProxyType({
+    'Nainital': (29.3806, 79.4422),
+    'Almora': (29.5833, 79.6667),
+    'Dehradun': (30.3165, 78.0322),
+    'Haridwar': (29.9458, 78.1642),
+    'Rishikesh': (30.0869, 78.2676)
+})
+
+# Simulated base risk per region, used when no predictions are available
+_BASE_RISKS = MappingProxyType({
+    'Nainital': 0.75,
+    'Almora': 0.65,
+    'Dehradun': 0.45,
+    'Haridwar': 0.35,
+    'Rishikesh': 0.40
+})
+_REGIONS = tuple(_BASE_RISKS)
+_BASE_RISK_VECTOR = np.fromiter(_BASE_RISKS.values(), dtype=np.float32, count=len(_BASE_RISKS))
+_BASE_RISK_VECTOR.flags.writeable = False
+
+# Alert level for each threshold bin produced by np.digitize
+RISK_LEVELS_BY_BIN = (None, 'high', 'very-high')
+
+# Alert message templates, filled with region, risk_score and time
+CRITICAL_ALERT_TEMPLATE = (
+    "🚨 CRITICAL FIRE ALERT 🚨\n\nRegion: {region}\nRisk Level: VERY HIGH ({risk_score:.1%})\nTime: {time}\n\n"
+    "IMMEDIATE ACTION REQUIRED:\n• Deploy fire crews\n• Initiate evacuation protocols\n• Contact emergency services\n"
+    "• Follow evacuation routes to safe zones\n\n"
+    "Evacuation routes have been generated and are available on the dashboard.\n\nNeuroNix Fire Intelligence"
+)
+HIGH_ALERT_TEMPLATE = (
+    "⚠️ HIGH FIRE RISK ALERT ⚠️\n\nRegion: {region}\nRisk Level: HIGH ({risk_score:.1%})\nTime: {time}\n\n"
+    "RECOMMENDED ACTIONS:\n• Increase patrol frequency\n• Prepare response teams\n• Monitor conditions closely\n"
+    "• Review evacuation plans\n\n"
+    "Evacuation routes available if needed.\n\nNeuroNix Fire Intelligence"
+)
+
+@dataclass(slots=True)
 class Alert:
     id: str
     timestamp: datetime
@@ -29,6 +79,7 @@ class Alert:
     status: str  # 'active', 'acknowledged', 'resolved'
     recipients: List[str]
     alert_type: str  # 'sms', 'whatsapp', 'dashboard'
+    evacuation_routes: Optional[Dict] = None  # filled in by the sender threads
 
 class EarlyWarningSystem:
     def __init__(self):
@@ -38,16 +89,63 @@ class EarlyWarningSystem:
         self.twilio_phone_number = os.getenv('TWILIO_PHONE_NUMBER', '+1234567890')
         self.twilio_whatsapp_number = os.getenv('TWILIO_WHATSAPP_NUMBER', 'whatsapp:+14155238886')
         
+        # ML API used for regional risk polling (unset = simulated risk)
+        self.ml_api_url = os.getenv('ML_API_URL')
+        
+        # Pooled HTTP session shared by Twilio sends and ML API polls, so TLS and
+        # TCP handshakes are paid once per host instead of once per request
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._http = requests.Session()
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
         # Initialize Twilio client
         if TWILIO_AVAILABLE and self.twilio_account_sid != 'demo_sid':
-            self.twilio_client = Client(self.twilio_account_sid, self.twilio_auth_token)
+            from twilio.rest import Client
+            from twilio.http.http_client import TwilioHttpClient
+            
+            http_client = TwilioHttpClient(pool_connections=True)
+            http_client.session = self._http
+            self.twilio_client = Client(self.twilio_account_sid, self.twilio_auth_token, http_client=http_client)
         else:
             self.twilio_client = None
             print("Using demo mode for alerts (no actual SMS/WhatsApp sent)")
         
-        # Alert storage
-        self.active_alerts = []
-        self.alert_history = []
+        # Shared pool for fanning out Twilio sends; the semaphore caps in-flight
+        # requests so a large recipient list stays under the account's rate limit
+        self._send_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='twilio-send')
+        self._send_quota = BoundedSemaphore(int(os.getenv('TWILIO_MAX_CONCURRENT_SENDS', '10')))
+        self.send_timeout = 10  # seconds to wait for one alert's fan-out
+        
+        # Triggered alerts are handed to sender threads so route generation and
+        # Twilio latency never block the monitoring thread or request handlers
+        self._alert_queue = queue.Queue(maxsize=1024)
+        self.dropped_notifications = 0
+        self._sender_threads = [
+            Thread(target=self._sender_worker, name=f'alert-sender-{i}', daemon=True)
+            for i in range(4)
+        ]
+        for sender in self._sender_threads:
+            sender.start()
+        
+        # Alert storage: active alerts keyed by id, plus the ids of each region's alerts still in
+        # 'active' status, oldest first (dict used as an ordered set).
+        # Mutated by the monitoring thread and request handlers, so guarded by _lock.
+        self._lock = RLock()
+        self.active_alerts: Dict[str, Alert] = {}
+        self._region_active_ids: Dict[str, Dict[str, None]] = {}
+        
+        # Serialized /api/alerts/active payload, rebuilt only after a mutation.
+        # The tag prefix keeps ETags from one process run distinct from the next.
+        self._active_json_cache: Optional[bytes] = None
+        self._active_version = 0
+        self._etag_prefix = f"{os.getpid():x}{int(time.time()):x}"
+        # Resolved alerts in resolution order, oldest dropped first
+        self.alert_history = deque(maxlen=10_000)
         self.field_officers = [
             {
                 'name': 'Officer Raj Singh',
@@ -69,10 +167,31 @@ class EarlyWarningSystem:
             }
         ]
         
+        # Officer phone numbers indexed by region
+        self._officers_by_region: Dict[str, List[str]] = {}
+        for officer in self.field_officers:
+            self._officers_by_region.setdefault(officer['region'], []).append(officer['phone'])
+        
         # Risk thresholds
         self.high_risk_threshold = 0.7
         self.very_high_risk_threshold = 0.85
         
+        # Evacuation route generator, resolved once instead of on every alert
+        try:
+            from evacuation_routes import evacuation_system
+            self._evacuation_system = evacuation_system
+        except ImportError:
+            self._evacuation_system = None
+            print("Evacuation routes not available")
+        
+        # RNG for the simulated regional risks
+        self._rng = np.random.default_rng()
+        
+        # Scores pushed by the ML prediction producer, drained by the monitor
+        self._cv = Condition()
+        self._pending_scores: Dict[str, float] = {}
+        self.watchdog_interval = 300  # seconds between full sweeps when no scores arrive
+        
         # Start monitoring thread
         self.monitoring_active = True
         self.monitoring_thread = Thread(target=self._monitoring_loop, daemon=True)
@@ -82,68 +201,109 @@ class EarlyWarningSystem:
         """Continuous monitoring loop for risk assessment"""
         while self.monitoring_active:
             try:
-                # Check current predictions from ML API
                 self._check_risk_levels()
-                time.sleep(60)  # Check every minute
+                
+                # Park until a new score is pushed; the timeout acts as a watchdog sweep
+                with self._cv:
+                    self._cv.wait_for(
+                        lambda: self._pending_scores or not self.monitoring_active,
+                        timeout=self.watchdog_interval
+                    )
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
                 time.sleep(30)
     
+    def push_score(self, region, risk_score):
+        """Record a new risk score for a region and wake the monitoring thread"""
+        with self._cv:
+            self._pending_scores[region] = risk_score
+            self._cv.notify()
+    
+    def stop_monitoring(self):
+        """Stop the monitoring thread"""
+        with self._cv:
+            self.monitoring_active = False
+            self._cv.notify_all()
+    
     def _check_risk_levels(self):
         """Check current risk levels and trigger alerts if necessary"""
         try:
-            # Get current predictions from ML API
-            regions = ['Nainital', 'Almora', 'Dehradun', 'Haridwar', 'Rishikesh']
+            with self._cv:
+                pending, self._pending_scores = self._pending_scores, {}
             
-            for region in regions:
-                # Simulate getting regional risk data
-                risk_score = self._get_regional_risk(region)
-                
-                if risk_score >= self.very_high_risk_threshold:
-                    self._trigger_alert(region, 'very-high', risk_score)
-                elif risk_score >= self.high_risk_threshold:
-                    self._trigger_alert(region, 'high', risk_score)
+            if pending:
+                regions = tuple(pending)
+                scores = np.fromiter(pending.values(), dtype=np.float64, count=len(pending))
+            else:
+                # No fresh predictions were pushed, so poll every region
+                regions = _REGIONS
+                scores = self._get_regional_risks()
+            
+            # 0 = below threshold, 1 = high, 2 = very-high
+            levels = np.digitize(scores, [self.high_risk_threshold, self.very_high_risk_threshold])
+            
+            # One clock read per tick, shared by every alert it raises
+            now = datetime.now()
+            for i in np.flatnonzero(levels):
+                self._trigger_alert(regions[i], RISK_LEVELS_BY_BIN[levels[i]], float(scores[i]), now)
                     
         except Exception as e:
             print(f"Error checking risk levels: {e}")
     
-    def _get_regional_risk(self, region):
-        """Get risk score for a specific region"""
-        # This would normally call your ML API
-        # For demo purposes, we'll simulate varying risk levels
-        import random
-        base_risks = {
-            'Nainital': 0.75,
-            'Almora': 0.65,
-            'Dehradun': 0.45,
-            'Haridwar': 0.35,
-            'Rishikesh': 0.40
-        }
-        
-        base_risk = base_risks.get(region, 0.5)
-        # Add some variation
-        variation = (random.random() - 0.5) * 0.2
-        return max(0, min(1, base_risk + variation))
-    
-    def _trigger_alert(self, region, risk_level, risk_score):
+    def _get_regional_risks(self):
+        """Get risk scores for all monitored regions, in _REGIONS order"""
+        if self.ml_api_url:
+            scores = self._fetch_ml_risks()
+            if scores is not None:
+                return scores
+        
+        # For demo purposes, we'll simulate varying risk levels in one batched draw
+        variation = (self._rng.random(len(_BASE_RISK_VECTOR), dtype=np.float32) - 0.5) * 0.2
+        return np.clip(_BASE_RISK_VECTOR + variation, 0, 1)
+    
+    def _fetch_ml_risks(self):
+        """Fetch real-time ensemble risk scores from the ML API, or None if unavailable"""
+        try:
+            response = self._http.get(f"{self.ml_api_url}/api/ml/realtime", timeout=2)
+            response.raise_for_status()
+            predictions = response.json().get('predictions', {})
+        except Exception as e:
+            print(f"Failed to fetch ML predictions: {e}")
+            return None
+        
+        if not predictions:
+            return None
+        
+        return np.fromiter(
+            (predictions.get(region, {}).get('prediction', {}).get('ensemble_risk_score', 0.0)
+             for region in _REGIONS),
+            dtype=np.float64,
+            count=len(_REGIONS)
+        )
+    
+    def _trigger_alert(self, region, risk_level, risk_score, now=None):
         """Trigger an alert for high risk conditions"""
-        # Check if we already have an active alert for this region
-        existing_alert = None
-        for alert in self.active_alerts:
-            if alert.region == region and alert.status == 'active':
-                existing_alert = alert
-                break
-        
-        # Only create new alert if risk level has increased or no active alert exists
-        if not existing_alert or (existing_alert and self._is_risk_escalated(existing_alert.risk_level, risk_level)):
-            alert_id = f"{region}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        with self._lock:
+            # Check if we already have an active alert for this region (the oldest one, as before)
+            region_ids = self._region_active_ids.get(region)
+            existing_alert = self.active_alerts[next(iter(region_ids))] if region_ids else None
+            
+            # Only create new alert if risk level has increased or no active alert exists
+            if existing_alert and not self._is_risk_escalated(existing_alert.risk_level, risk_level):
+                return
+            
+            timestamp = now or datetime.now()
+            alert_id = f"{region}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+            if alert_id in self.active_alerts:
+                # An escalation within the same second must not replace the earlier alert
+                alert_id = f"{alert_id}_{len(self.active_alerts)}"
             
-            message = self._generate_alert_message(region, risk_level, risk_score)
+            message = self._generate_alert_message(region, risk_level, risk_score, timestamp)
             recipients = self._get_recipients_for_region(region)
             
             alert = Alert(
                 id=alert_id,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 region=region,
                 risk_level=risk_level,
                 risk_score=risk_score,
@@ -153,18 +313,38 @@ class EarlyWarningSystem:
                 alert_type='multi'
             )
             
-            # Generate evacuation routes for high risk alerts
-            if risk_level in ['high', 'very-high']:
-                alert.evacuation_routes = self._generate_evacuation_info(region, risk_score)
-            
             # Add to active alerts
-            self.active_alerts.append(alert)
-            
-            # Send notifications
-            self._send_sms_alert(alert)
-            self._send_whatsapp_alert(alert)
-            
-            print(f"Alert triggered for {region}: {risk_level} risk ({risk_score:.2f})")
+            self.active_alerts[alert.id] = alert
+            self._region_active_ids.setdefault(region, {})[alert.id] = None
+            self._invalidate_active_cache()
+        
+        # Route generation and sends do network I/O, so hand them to the sender threads
+        try:
+            self._alert_queue.put_nowait(alert)
+        except queue.Full:
+            # The alert stays active on the dashboard; only the notifications are dropped
+            with self._lock:
+                self.dropped_notifications += 1
+            print(f"Notification queue full, dropped notifications for alert {alert.id}")
+        
+        print(f"Alert triggered for {region}: {risk_level} risk ({risk_score:.2f})")
+    
+    def _sender_worker(self):
+        """Consume triggered alerts and deliver their notifications"""
+        while True:
+            alert = self._alert_queue.get()
+            try:
+                # Generate evacuation routes for high risk alerts
+                if alert.risk_level in ['high', 'very-high']:
+                    alert.evacuation_routes = self._generate_evacuation_info(alert.region, alert.risk_score)
+                
+                # Send notifications
+                self._send_sms_alert(alert)
+                self._send_whatsapp_alert(alert)
+            except Exception as e:
+                print(f"Error sending notifications for alert {alert.id}: {e}")
+            finally:
+                self._alert_queue.task_done()
     
     def _is_risk_escalated(self, current_level, new_level):
         """Check if risk level has escalated"""
@@ -173,58 +353,44 @@ class EarlyWarningSystem:
         new_index = risk_hierarchy.index(new_level) if new_level in risk_hierarchy else 0
         return new_index > current_index
     
-    def _generate_alert_message(self, region, risk_level, risk_score):
+    def _generate_alert_message(self, region, risk_level, risk_score, timestamp):
         """Generate alert message based on risk level"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-        
-        if risk_level == 'very-high':
-            message = f"🚨 CRITICAL FIRE ALERT 🚨\n\nRegion: {region}\nRisk Level: VERY HIGH ({risk_score:.1%})\nTime: {timestamp}\n\nIMMEDIATE ACTION REQUIRED:\n• Deploy fire crews\n• Initiate evacuation protocols\n• Contact emergency services\n• Follow evacuation routes to safe zones\n\nEvacuation routes have been generated and are available on the dashboard.\n\nNeuroNix Fire Intelligence"
-        else:
-            message = f"⚠️ HIGH FIRE RISK ALERT ⚠️\n\nRegion: {region}\nRisk Level: HIGH ({risk_score:.1%})\nTime: {timestamp}\n\nRECOMMENDED ACTIONS:\n• Increase patrol frequency\n• Prepare response teams\n• Monitor conditions closely\n• Review evacuation plans\n\nEvacuation routes available if needed.\n\nNeuroNix Fire Intelligence"
-        
-        return message
+        template = CRITICAL_ALERT_TEMPLATE if risk_level == 'very-high' else HIGH_ALERT_TEMPLATE
+        return template.format(
+            region=region,
+            risk_score=risk_score,
+            time=timestamp.strftime('%Y-%m-%d %H:%M')
+        )
     
     def _generate_evacuation_info(self, region, risk_score):
         """Generate evacuation route information for alerts"""
-        # Region coordinates (simplified mapping)
-        region_coords = {
-            'Nainital': (29.3806, 79.4422),
-            'Almora': (29.5833, 79.6667),
-            'Dehradun': (30.3165, 78.0322),
-            'Haridwar': (29.9458, 78.1642),
-            'Rishikesh': (30.0869, 78.2676)
+        unavailable = {
+            'available': False,
+            'message': 'Evacuation routes will be generated when needed'
         }
+        if self._evacuation_system is None:
+            return unavailable
         
-        coords = region_coords.get(region, (30.0, 79.0))
+        coords = _REGION_COORDS.get(region, (30.0, 79.0))
         
         try:
-            # Try to get evacuation routes from the evacuation system
-            from evacuation_routes import evacuation_system
-            routes = evacuation_system.generate_evacuation_routes(coords[0], coords[1], 5)
-            
-            return {
-                'available': True,
-                'route_count': len(routes),
-                'primary_destination': routes[0]['destination']['name'] if routes else 'Multiple safe zones',
-                'estimated_time': routes[0]['estimated_time_minutes'] if routes else 'Variable',
-                'fire_location': coords
-            }
-        except:
-            return {
-                'available': False,
-                'message': 'Evacuation routes will be generated when needed'
-            }
+            routes = self._evacuation_system.generate_evacuation_routes(coords[0], coords[1], 5)
+        except Exception as e:
+            print(f"Failed to generate evacuation routes for {region}: {e}")
+            return unavailable
+        
+        return {
+            'available': True,
+            'route_count': len(routes),
+            'primary_destination': routes[0]['destination']['name'] if routes else 'Multiple safe zones',
+            'estimated_time': routes[0]['estimated_time_minutes'] if routes else 'Variable',
+            'fire_location': coords
+        }
     
     def _get_recipients_for_region(self, region):
         """Get phone numbers of officers responsible for a region"""
-        recipients = []
-        for officer in self.field_officers:
-            if officer['region'] == region:
-                recipients.append(officer['phone'])
-        
         # Add central emergency number
-        recipients.append('+919876543200')  # Central emergency coordination
-        return recipients
+        return self._officers_by_region.get(region, []) + [CENTRAL_EMERGENCY_NUMBER]
     
     def _send_sms_alert(self, alert):
         """Send SMS alert using Twilio"""
@@ -232,16 +398,7 @@ class EarlyWarningSystem:
             print(f"[DEMO SMS] Alert sent to {len(alert.recipients)} recipients for {alert.region}")
             return
         
-        for recipient in alert.recipients:
-            try:
-                message = self.twilio_client.messages.create(
-                    body=alert.message,
-                    from_=self.twilio_phone_number,
-                    to=recipient
-                )
-                print(f"SMS sent to {recipient}: {message.sid}")
-            except Exception as e:
-                print(f"Failed to send SMS to {recipient}: {e}")
+        self._send_to_recipients(alert, 'SMS', self.twilio_phone_number)
     
     def _send_whatsapp_alert(self, alert):
         """Send WhatsApp alert using Twilio"""
@@ -249,68 +406,148 @@ class EarlyWarningSystem:
             print(f"[DEMO WhatsApp] Alert sent to {len(alert.recipients)} recipients for {alert.region}")
             return
         
-        for recipient in alert.recipients:
-            try:
-                message = self.twilio_client.messages.create(
-                    body=alert.message,
-                    from_=self.twilio_whatsapp_number,
-                    to=f'whatsapp:{recipient}'
-                )
-                print(f"WhatsApp sent to {recipient}: {message.sid}")
-            except Exception as e:
-                print(f"Failed to send WhatsApp to {recipient}: {e}")
+        self._send_to_recipients(alert, 'WhatsApp', self.twilio_whatsapp_number, to_prefix='whatsapp:')
+    
+    def _send_to_recipients(self, alert, channel, from_number, to_prefix=''):
+        """Send the alert message to all recipients concurrently and log each outcome"""
+        futures = {
+            self._send_pool.submit(self._create_message, alert.message, from_number, f'{to_prefix}{recipient}'): recipient
+            for recipient in alert.recipients
+        }
+        
+        done, pending = wait(futures, timeout=self.send_timeout)
+        
+        for future in done:
+            recipient = futures[future]
+            error = future.exception()
+            if error:
+                print(f"Failed to send {channel} to {recipient}: {error}")
+            else:
+                print(f"{channel} sent to {recipient}: {future.result().sid}")
+        
+        for future in pending:
+            print(f"Timed out sending {channel} to {futures[future]}")
+    
+    def _create_message(self, body, from_number, to_number):
+        """Create a single Twilio message, holding a slot of the send quota"""
+        with self._send_quota:
+            return self.twilio_client.messages.create(
+                body=body,
+                from_=from_number,
+                to=to_number
+            )
     
     def acknowledge_alert(self, alert_id, officer_name):
         """Mark an alert as acknowledged"""
-        for alert in self.active_alerts:
-            if alert.id == alert_id:
-                alert.status = 'acknowledged'
-                print(f"Alert {alert_id} acknowledged by {officer_name}")
-                return True
-        return False
+        with self._lock:
+            alert = self.active_alerts.get(alert_id)
+            if alert is None:
+                return False
+            
+            alert.status = 'acknowledged'
+            self._forget_active_id(alert)
+            self._invalidate_active_cache()
+        
+        print(f"Alert {alert_id} acknowledged by {officer_name}")
+        return True
     
     def resolve_alert(self, alert_id, officer_name):
         """Mark an alert as resolved and move to history"""
-        for i, alert in enumerate(self.active_alerts):
-            if alert.id == alert_id:
-                alert.status = 'resolved'
-                self.alert_history.append(alert)
-                del self.active_alerts[i]
-                print(f"Alert {alert_id} resolved by {officer_name}")
-                return True
-        return False
+        with self._lock:
+            alert = self.active_alerts.pop(alert_id, None)
+            if alert is None:
+                return False
+            
+            self._forget_active_id(alert)
+            alert.status = 'resolved'
+            self.alert_history.append(alert)
+            self._invalidate_active_cache()
+        
+        print(f"Alert {alert_id} resolved by {officer_name}")
+        return True
+    
+    def _forget_active_id(self, alert):
+        """Drop an alert from its region's still-active ids; call with _lock held"""
+        region_ids = self._region_active_ids.get(alert.region)
+        if region_ids is not None:
+            region_ids.pop(alert.id, None)
+            if not region_ids:
+                del self._region_active_ids[alert.region]
+    
+    def get_active_alert_count(self):
+        """Get the number of active alerts"""
+        with self._lock:
+            return len(self.active_alerts)
+    
+    def _invalidate_active_cache(self):
+        """Drop the cached active alerts payload; call with _lock held"""
+        self._active_version += 1
+        self._active_json_cache = None
+    
+    @staticmethod
+    def _serialize_alert(alert):
+        """Convert an alert to its API representation"""
+        return {
+            'id': alert.id,
+            'timestamp': alert.timestamp.isoformat(),
+            'region': alert.region,
+            'risk_level': alert.risk_level,
+            'risk_score': alert.risk_score,
+            'message': alert.message,
+            'status': alert.status,
+            'recipients_count': len(alert.recipients)
+        }
     
     def get_active_alerts(self):
         """Get all active alerts"""
-        return [
-            {
-                'id': alert.id,
-                'timestamp': alert.timestamp.isoformat(),
-                'region': alert.region,
-                'risk_level': alert.risk_level,
-                'risk_score': alert.risk_score,
-                'message': alert.message,
-                'status': alert.status,
-                'recipients_count': len(alert.recipients)
-            }
-            for alert in self.active_alerts
-        ]
+        # Snapshot under the lock, build the response dicts after releasing it
+        with self._lock:
+            alerts = list(self.active_alerts.values())
+        
+        return [self._serialize_alert(alert) for alert in alerts]
+    
+    def get_active_alerts_json(self):
+        """Get the serialized active alerts response and its ETag"""
+        with self._lock:
+            version = self._active_version
+            payload = self._active_json_cache
+            if payload is None:
+                alerts = list(self.active_alerts.values())
+        
+        if payload is None:
+            serialized = [self._serialize_alert(alert) for alert in alerts]
+            payload = dumps_bytes({
+                'success': True,
+                'alerts': serialized,
+                'count': len(serialized)
+            })
+            
+            with self._lock:
+                # Only cache if nothing changed while we were serializing
+                if self._active_version == version:
+                    self._active_json_cache = payload
+        
+        return payload, f"{self._etag_prefix}-{version}"
+    
+    def _history_snapshot(self, limit):
+        """Get up to limit resolved alerts, newest first"""
+        with self._lock:
+            return list(islice(reversed(self.alert_history), max(limit, 0)))
     
     def get_alert_history(self, limit=50):
         """Get alert history"""
-        return [
-            {
-                'id': alert.id,
-                'timestamp': alert.timestamp.isoformat(),
-                'region': alert.region,
-                'risk_level': alert.risk_level,
-                'risk_score': alert.risk_score,
-                'message': alert.message,
-                'status': alert.status,
-                'recipients_count': len(alert.recipients)
-            }
-            for alert in sorted(self.alert_history, key=lambda x: x.timestamp, reverse=True)[:limit]
-        ]
+        return [self._serialize_alert(alert) for alert in self._history_snapshot(limit)]
+    
+    def iter_alert_history_json(self, limit=50):
+        """Yield the alert history response as JSON chunks, one alert at a time"""
+        alerts = self._history_snapshot(limit)
+        
+        yield b'{"alerts":['
+        for i, alert in enumerate(alerts):
+            if i:
+                yield b','
+            yield dumps_bytes(self._serialize_alert(alert))
+        yield f'],"count":{len(alerts)},"success":true}}'.encode('utf-8')
 
 # Global alert system instance
 alert_system = EarlyWarningSystem()
@@ -708,26 +945,35 @@ MOBILE_DASHBOARD_TEMPLATE = """
 </html>
 """
 
+# The dashboard has no template variables, so encode it once and serve the bytes
+_DASHBOARD_BYTES = MOBILE_DASHBOARD_TEMPLATE.encode('utf-8')
+_DASHBOARD_ETAG = hashlib.sha1(_DASHBOARD_BYTES).hexdigest()
+
 # Flask app for mobile dashboard
 def create_alert_app():
     app = Flask(__name__)
     CORS(app)
+    install_json_provider(app)
     
     @app.route('/field-dashboard')
     def mobile_dashboard():
         """Mobile-friendly dashboard for field officers"""
-        return render_template_string(MOBILE_DASHBOARD_TEMPLATE)
+        response = Response(
+            _DASHBOARD_BYTES,
+            mimetype='text/html',
+            headers={'Cache-Control': 'public, max-age=300'}
+        )
+        response.set_etag(_DASHBOARD_ETAG)
+        return response.make_conditional(request)
     
     @app.route('/api/alerts/active')
     def get_active_alerts():
         """API endpoint to get active alerts"""
         try:
-            alerts = alert_system.get_active_alerts()
-            return jsonify({
-                'success': True,
-                'alerts': alerts,
-                'count': len(alerts)
-            })
+            payload, etag = alert_system.get_active_alerts_json()
+            response = Response(payload, mimetype='application/json')
+            response.set_etag(etag, weak=True)
+            return response.make_conditional(request)
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -751,6 +997,15 @@ def create_alert_app():
                 'error': str(e)
             }), 500
     
+    @app.route('/api/alerts/history/stream')
+    def stream_alert_history():
+        """API endpoint to stream alert history without building the full response in memory"""
+        limit = request.args.get('limit', 50, type=int)
+        return Response(
+            stream_with_context(alert_system.iter_alert_history_json(limit)),
+            mimetype='application/json'
+        )
+    
     @app.route('/api/alerts/acknowledge', methods=['POST'])
     def acknowledge_alert():
         """API endpoint to acknowledge an alert"""
@@ -820,7 +1075,8 @@ def create_alert_app():
             'status': {
                 'monitoring_active': alert_system.monitoring_active,
                 'twilio_available': TWILIO_AVAILABLE,
-                'active_alerts_count': len(alert_system.active_alerts),
+                'active_alerts_count': alert_system.get_active_alert_count(),
+                'dropped_notifications': alert_system.dropped_notifications,
                 'field_officers_count': len(alert_system.field_officers),
                 'last_check': datetime.now().isoformat()
             }
@@ -829,6 +1085,9 @@ def create_alert_app():
     return app
 
 if __name__ == '__main__':
-    # Create and run the alert system app
+    # Create and run the alert system app on the threaded development server.
+    # The reloader is left off because it would start a second monitoring thread.
+    # For production use gunicorn: gunicorn -c gunicorn.conf.py wsgi:application
+    from werkzeug.serving import run_simple
     app = create_alert_app()
-    app.run(host='0.0.0.0', port=5002, debug=True)
+    run_simple('0.0.0.0', 5002, app, threaded=True)
@@ -1,13 +1,182 @@
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import numpy as np
 from typing import List, Dict, Tuple
-from dataclasses import dataclass
-import math
+from dataclasses import dataclass, field
+from math import sin, cos, radians, asin, atan2, sqrt, pi
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from json_provider import dumps_bytes
 
-@dataclass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Fast JSON parsing for large OSRM geometries: orjson, then ujson, then the stdlib
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371  # Earth's radius in kilometers
+
+# OSRM demo server for routing
+OSRM_ROUTE_URL = "http://router.project-osrm.org/route/v1/driving/{start_lng},{start_lat};{end_lng},{end_lat}"
+OSRM_PARAMS = {
+    'overview': 'full',
+    'geometries': 'geojson',
+    'steps': 'true'
+}
+# Route lookups are cached on coordinates rounded to 4 decimals (about 11 m)
+OSRM_COORD_DECIMALS = 4
+
+# Safe-zone coordinates are also stored as int32 degrees x 1e7 (about 1 cm) and
+# expanded to float32 radians for distance sweeps over large zone tables
+COORD_FIXED_SCALE = 10_000_000
+_FIXED_TO_RAD = np.float32(pi / 180 / COORD_FIXED_SCALE)
+
+# Route endpoints snap to a major road point only within this distance
+ROAD_SNAP_MAX_KM = 20
+
+# Below this many safe zones a linear NumPy scan is faster than a KD-tree query
+KDTREE_MIN_ZONES = 64
+
+# Zone tables smaller than this are ranked with scalar math: NumPy's per-call
+# overhead outweighs the sweep itself for a handful of zones
+VECTOR_SWEEP_MIN_ZONES = 32
+
+# Distance sweeps over at least this many zones first shortlist them in float32;
+# for smaller tables the float32 conversion costs more than it saves
+FLOAT32_SWEEP_MIN_ZONES = 4096
+
+# Bound (km) on the error of a float32 zone distance; the float32 sweep only shortlists
+# zones and the final selection is made on float64 distances
+FLOAT32_DISTANCE_SLACK_KM = 0.01
+
+# (connect, read) timeouts: fail fast when OSRM is unreachable, allow slow route computations
+OSRM_TIMEOUT = (3, 10)
+
+# Shared session so repeated OSRM calls reuse connections; the pool is sized
+# for the concurrent fetches made by EvacuationRouteMapper._route_pool
+_session = requests.Session()
+for _prefix in ('http://', 'https://'):
+    _session.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+class _OSRMUnavailable(Exception):
+    """OSRM answered but returned no usable route"""
+
+@lru_cache(maxsize=1024)
+def _osrm_fetch(s_lat_q: float, s_lng_q: float, e_lat_q: float, e_lng_q: float) -> Dict:
+    """Fetch a route from OSRM for quantized coordinates; failures raise so they are not cached"""
+    osrm_url = OSRM_ROUTE_URL.format(start_lng=s_lng_q, start_lat=s_lat_q, end_lng=e_lng_q, end_lat=e_lat_q)
+    response = _session.get(osrm_url, params=OSRM_PARAMS, timeout=OSRM_TIMEOUT)
+    
+    if response.status_code != 200:
+        raise _OSRMUnavailable(response.status_code)
+    
+    data = _json_loads(response.content)
+    if not data.get('routes'):
+        raise _OSRMUnavailable('no routes')
+    
+    route = data['routes'][0]
+    return {
+        'success': True,
+        'geometry': route['geometry']['coordinates'],
+        'distance': route['distance'] / 1000,  # Convert to km
+        'duration': route['duration'] / 60,    # Convert to minutes
+        'steps': [step['maneuver']['instruction'] for step in route['legs'][0]['steps']]
+    }
+
+def _haversine_vec(lat, lng, lats_rad: np.ndarray, lngs_rad: np.ndarray,
+                   cos_lats: np.ndarray) -> np.ndarray:
+    """Haversine distances (km) from query points in degrees (broadcast against the targets) to many
+    points with precomputed radians and cos(lat), computed in the targets' dtype"""
+    lat_rad = np.radians(np.asarray(lat, dtype=lats_rad.dtype))
+    lng_rad = np.radians(np.asarray(lng, dtype=lats_rad.dtype))
+    a = (np.sin((lats_rad - lat_rad) / 2) ** 2 +
+         np.cos(lat_rad) * cos_lats * np.sin((lngs_rad - lng_rad) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+@lru_cache(maxsize=4096)
+def _hav(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Haversine distance (km) between two points, cached for overlapping route geometries"""
+    lat1_rad = radians(lat1)
+    lat2_rad = radians(lat2)
+    delta_lat = radians(lat2 - lat1)
+    delta_lng = radians(lng2 - lng1)
+    
+    a = (sin(delta_lat / 2) ** 2 + 
+         cos(lat1_rad) * cos(lat2_rad) * sin(delta_lng / 2) ** 2)
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    
+    return EARTH_RADIUS_KM * c
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _safety_kernel(geom: np.ndarray, fire_lat: float, fire_lng: float, risk_radius: float) -> float:
+        """Safety score of an (N x 2) [lng, lat] route geometry in one pass"""
+        n = geom.shape[0]
+        quarter = n // 4
+        fire_lat_rad = radians(fire_lat)
+        cos_fire_lat = cos(fire_lat_rad)
+        safe_points = 0
+        early_exit = False
+        
+        for i in range(n):
+            lat = geom[i, 1]
+            delta_lat = radians(lat - fire_lat)
+            delta_lng = radians(geom[i, 0] - fire_lng)
+            a = (sin(delta_lat / 2) ** 2 + 
+                 cos_fire_lat * cos(radians(lat)) * sin(delta_lng / 2) ** 2)
+            is_safe = EARTH_RADIUS_KM * (2 * atan2(sqrt(a), sqrt(1 - a))) > risk_radius
+            if is_safe:
+                safe_points += 1
+            if i == quarter:
+                early_exit = is_safe
+        
+        base_safety = safe_points / n
+        
+        # Add bonus for routes that quickly exit risk zone
+        if n > 2 and early_exit:
+            base_safety += 0.2
+        
+        return min(1.0, base_safety)
+else:
+    def _safety_kernel(geom: np.ndarray, fire_lat: float, fire_lng: float, risk_radius: float) -> float:
+        """Safety score of an (N x 2) [lng, lat] route geometry in one NumPy pass"""
+        n = geom.shape[0]
+        lats = geom[:, 1]
+        a = (np.sin(np.radians(lats - fire_lat) / 2) ** 2 +
+             cos(radians(fire_lat)) * np.cos(np.radians(lats)) * np.sin(np.radians(geom[:, 0] - fire_lng) / 2) ** 2)
+        is_safe = EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))) > risk_radius
+        
+        base_safety = np.count_nonzero(is_safe) / n
+        
+        # Add bonus for routes that quickly exit risk zone
+        if n > 2 and is_safe[n // 4]:
+            base_safety += 0.2
+        
+        return min(1.0, base_safety)
+
+# Compile the safety kernel at import so the first request doesn't pay for it
+if NUMBA_AVAILABLE:
+    _safety_kernel(np.zeros((3, 2)), 0.0, 0.0, 1.0)
+
+@dataclass(slots=True)
 class SafeZone:
     name: str
     lat: float
@@ -15,18 +184,61 @@ class SafeZone:
     capacity: int
     type: str  # 'school', 'hospital', 'government', 'community_center'
     facilities: List[str]
+    lat_rad: float = field(init=False, repr=False, compare=False)
+    lng_rad: float = field(init=False, repr=False, compare=False)
+    cos_lat: float = field(init=False, repr=False, compare=False)
+    coords_list: List[float] = field(init=False, repr=False, compare=False)
+    payload_base: Dict = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Cache radians and cos(lat) used by the distance queries, and the API payload"""
+        self.lat_rad = radians(self.lat)
+        self.lng_rad = radians(self.lng)
+        self.cos_lat = cos(self.lat_rad)
+        # Shared by every response that lists this zone, treat as read-only
+        self.coords_list = [self.lat, self.lng]
+        self.payload_base = {
+            'name': self.name,
+            'type': self.type,
+            'capacity': self.capacity,
+            'facilities': self.facilities,
+            'coordinates': self.coords_list
+        }
+
+# Route colors for map visualization
+ROUTE_COLORS = {
+    'primary': '#10b981',    # Green
+    'secondary': '#f59e0b',  # Yellow
+    'emergency': '#ef4444'   # Red
+}
 
-@dataclass
+@dataclass(slots=True)
 class EvacuationRoute:
+    """Unrounded evacuation route to one safe zone"""
     route_id: str
-    start_point: Tuple[float, float]
-    end_point: Tuple[float, float]
-    waypoints: List[Tuple[float, float]]
+    destination: SafeZone
+    geometry: List[List[float]]  # [lng, lat] points
     distance_km: float
-    estimated_time_minutes: int
+    estimated_time_minutes: float
     safety_score: float
     route_type: str  # 'primary', 'secondary', 'emergency'
     instructions: List[str]
+    priority: int
+    
+    def to_dict(self) -> Dict:
+        """Legacy generate_evacuation_routes dict, rounded for presentation"""
+        return {
+            'route_id': self.route_id,
+            'destination': self.destination.payload_base,
+            'geometry': self.geometry,
+            'distance_km': round(self.distance_km, 2),
+            'estimated_time_minutes': round(self.estimated_time_minutes, 0),
+            'safety_score': round(self.safety_score, 2),
+            'route_type': self.route_type,
+            'instructions': self.instructions,
+            'color': ROUTE_COLORS.get(self.route_type, '#6b7280'),
+            'priority': self.priority
+        }
 
 class EvacuationRouteMapper:
     def __init__(self):
@@ -56,63 +268,155 @@ class EvacuationRouteMapper:
         # OpenStreetMap Overpass API endpoint
         self.overpass_url = "https://overpass-api.de/api/interpreter"
         
-    def calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate distance between two points using Haversine formula"""
-        R = 6371  # Earth's radius in kilometers
+        self._index_safe_zones()
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
+        # Road points in radians for vectorized distance queries
+        self._road_points = [point for road in self.major_roads for point in road['points']]
+        self._road_coords = np.deg2rad(np.array(self._road_points))
+        self._road_cos_lat = np.cos(self._road_coords[:, 0])
         
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        # OSRM lookups for the candidate zones are independent, so fetch them concurrently
+        self._route_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='osrm-route')
+        
+    def _index_safe_zones(self):
+        """Build the payloads, arrays and KD-tree derived from self.safe_zones"""
+        # Safe zones don't change between queries, so build their API payload once
+        self._zones_payload = [zone.payload_base for zone in self.safe_zones]
+        self._zones_json = dumps_bytes({
+            'success': True,
+            'safe_zones': self._zones_payload,
+            'count': len(self._zones_payload)
+        })
         
-        return R * c
+        # Coordinate columns of the safe zones for the vectorized ranking; SafeZone
+        # objects are only looked up for the zones that survive it
+        self.zone_lats = np.array([zone.lat for zone in self.safe_zones])
+        self.zone_lngs = np.array([zone.lng for zone in self.safe_zones])
+        
+        # Radians and cos(lat) for vectorized distance queries, plus the fixed-point
+        # coordinates and float32 cos(lat) used by the float32 sweep
+        self._zone_rad = np.radians(np.column_stack((self.zone_lats, self.zone_lngs)))
+        self._zone_cos_lat = np.cos(self._zone_rad[:, 0])
+        self._zones_i32 = np.round(
+            np.column_stack((self.zone_lats, self.zone_lngs)) * COORD_FIXED_SCALE
+        ).astype(np.int32)
+        self._zone_cos_lat32 = self._zone_cos_lat.astype(np.float32)
+        
+        # KD-tree over unit-sphere positions; chord length grows monotonically with great-circle distance
+        self._zone_tree = None
+        if SCIPY_AVAILABLE and len(self.safe_zones) >= KDTREE_MIN_ZONES:
+            lats_rad, lngs_rad = self._zone_rad.T
+            self._zone_tree = cKDTree(np.column_stack((
+                np.cos(lats_rad) * np.cos(lngs_rad),
+                np.cos(lats_rad) * np.sin(lngs_rad),
+                np.sin(lats_rad)
+            )))
+    
+    @staticmethod
+    def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+        """Calculate distance between two points using Haversine formula"""
+        return _hav(lat1, lng1, lat2, lng2)
     
     def find_nearest_safe_zones(self, fire_lat: float, fire_lng: float, 
                                risk_radius: float, max_zones: int = 5) -> List[SafeZone]:
         """Find nearest safe zones outside the risk radius"""
-        safe_zones_with_distance = []
+        if max_zones <= 0:
+            return []
         
-        for zone in self.safe_zones:
-            distance = self.calculate_distance(fire_lat, fire_lng, zone.lat, zone.lng)
-            
-            # Only consider zones outside the risk radius
+        if len(self.safe_zones) < VECTOR_SWEEP_MIN_ZONES:
+            return self._nearest_safe_zones_scalar(fire_lat, fire_lng, risk_radius, max_zones)
+        
+        if self._zone_tree is not None:
+            candidates = self._zone_tree_candidates(fire_lat, fire_lng, risk_radius, max_zones)
+        else:
+            candidates = np.arange(len(self.safe_zones))
+        if candidates.size >= FLOAT32_SWEEP_MIN_ZONES:
+            candidates = self._float32_shortlist(fire_lat, fire_lng, risk_radius, max_zones, candidates)
+        distances = _haversine_vec(fire_lat, fire_lng, self._zone_rad[candidates, 0],
+                                   self._zone_rad[candidates, 1], self._zone_cos_lat[candidates])
+        
+        # Only consider zones outside the risk radius, closest first
+        outside_mask = distances > risk_radius
+        outside = candidates[outside_mask]
+        distances = distances[outside_mask]
+        k = min(max_zones, outside.size)
+        if k == 0:
+            return []
+        
+        # Select the k closest in linear time, then order only those (ties by zone order)
+        if k < outside.size:
+            top = np.argpartition(distances, k - 1)[:k]
+            outside, distances = outside[top], distances[top]
+        nearest = outside[np.lexsort((outside, distances))]
+        return [self.safe_zones[i] for i in nearest]
+    
+    def _float32_shortlist(self, fire_lat: float, fire_lng: float, risk_radius: float,
+                           max_zones: int, candidates: np.ndarray) -> np.ndarray:
+        """Candidates that can still be among the max_zones nearest outside the risk radius once
+        their float64 distances are known, found with a float32 sweep"""
+        zone_rad = self._zones_i32[candidates].astype(np.float32) * _FIXED_TO_RAD
+        distances = _haversine_vec(fire_lat, fire_lng, zone_rad[:, 0], zone_rad[:, 1],
+                                   self._zone_cos_lat32[candidates])
+        
+        # Keep every zone that may lie outside the radius, up to FLOAT32_DISTANCE_SLACK_KM past
+        # the k-th zone that is certainly outside it
+        keep = distances > risk_radius - FLOAT32_DISTANCE_SLACK_KM
+        certain = distances[distances > risk_radius + FLOAT32_DISTANCE_SLACK_KM]
+        if certain.size >= max_zones:
+            kth = np.partition(certain, max_zones - 1)[max_zones - 1]
+            keep &= distances <= kth + 2 * FLOAT32_DISTANCE_SLACK_KM
+        return candidates[keep]
+    
+    def _nearest_safe_zones_scalar(self, fire_lat: float, fire_lng: float,
+                                   risk_radius: float, max_zones: int) -> List[SafeZone]:
+        """find_nearest_safe_zones for small zone tables, one zone at a time in float64"""
+        fire_lat_rad = radians(fire_lat)
+        fire_lng_rad = radians(fire_lng)
+        cos_fire_lat = cos(fire_lat_rad)
+        
+        outside = []
+        for i, zone in enumerate(self.safe_zones):
+            a = (sin((zone.lat_rad - fire_lat_rad) / 2) ** 2 +
+                 cos_fire_lat * zone.cos_lat * sin((zone.lng_rad - fire_lng_rad) / 2) ** 2)
+            distance = 2 * EARTH_RADIUS_KM * asin(sqrt(min(a, 1.0)))
             if distance > risk_radius:
-                safe_zones_with_distance.append((zone, distance))
+                outside.append((distance, i))
+        
+        # Closest first, ties by zone order
+        outside.sort()
+        return [self.safe_zones[i] for _, i in outside[:max_zones]]
+    
+    def _zone_tree_candidates(self, fire_lat: float, fire_lng: float,
+                              risk_radius: float, max_zones: int) -> np.ndarray:
+        """Indices of the zones that can contain the max_zones nearest outside the risk radius"""
+        fire_lat_rad = radians(fire_lat)
+        fire_lng_rad = radians(fire_lng)
+        cos_fire_lat = cos(fire_lat_rad)
+        point = (cos_fire_lat * cos(fire_lng_rad), cos_fire_lat * sin(fire_lng_rad), sin(fire_lat_rad))
+        
+        # Skip past every zone inside the radius (plus one for boundary rounding), so the
+        # nearest ones outside it are always among the candidates
+        angle = min(max(risk_radius, 0) / EARTH_RADIUS_KM, pi)
+        inside = self._zone_tree.query_ball_point(point, 2 * sin(angle / 2), return_length=True)
+        k = int(inside) + max_zones + 1
+        if k >= len(self.safe_zones):
+            return np.arange(len(self.safe_zones))
         
-        # Sort by distance and return closest ones
-        safe_zones_with_distance.sort(key=lambda x: x[1])
-        return [zone for zone, _ in safe_zones_with_distance[:max_zones]]
+        _, candidates = self._zone_tree.query(point, k=k)
+        return np.sort(candidates)
     
     def generate_route_via_osm(self, start_lat: float, start_lng: float, 
                               end_lat: float, end_lng: float) -> Dict:
         """Generate route using OpenStreetMap routing (fallback method)"""
         try:
-            # Use OSRM demo server for routing
-            osrm_url = f"http://router.project-osrm.org/route/v1/driving/{start_lng},{start_lat};{end_lng},{end_lat}"
-            params = {
-                'overview': 'full',
-                'geometries': 'geojson',
-                'steps': 'true'
-            }
-            
-            response = requests.get(osrm_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('routes'):
-                    route = data['routes'][0]
-                    return {
-                        'success': True,
-                        'geometry': route['geometry']['coordinates'],
-                        'distance': route['distance'] / 1000,  # Convert to km
-                        'duration': route['duration'] / 60,    # Convert to minutes
-                        'steps': [step['maneuver']['instruction'] for step in route['legs'][0]['steps']]
-                    }
+            route = _osrm_fetch(
+                round(start_lat, OSRM_COORD_DECIMALS), round(start_lng, OSRM_COORD_DECIMALS),
+                round(end_lat, OSRM_COORD_DECIMALS), round(end_lng, OSRM_COORD_DECIMALS)
+            )
+            # Copy so callers can't modify the cached route
+            return {**route, 'geometry': list(route['geometry']), 'steps': list(route['steps'])}
             
+        except _OSRMUnavailable:
             # Fallback to direct route
             return self.generate_direct_route(start_lat, start_lng, end_lat, end_lng)
             
@@ -145,34 +449,19 @@ class EvacuationRouteMapper:
         """Find intermediate waypoints using major roads"""
         waypoints = []
         
-        # Find the closest major road to start point
-        min_start_dist = float('inf')
-        closest_start_road = None
-        
-        for road in self.major_roads:
-            for point in road['points']:
-                dist = self.calculate_distance(start_lat, start_lng, point[0], point[1])
-                if dist < min_start_dist:
-                    min_start_dist = dist
-                    closest_start_road = point
-        
-        # Find the closest major road to end point
-        min_end_dist = float('inf')
-        closest_end_road = None
-        
-        for road in self.major_roads:
-            for point in road['points']:
-                dist = self.calculate_distance(end_lat, end_lng, point[0], point[1])
-                if dist < min_end_dist:
-                    min_end_dist = dist
-                    closest_end_road = point
+        # Find the closest major road point to the start and end points in one (2 x M) pass
+        dists = _haversine_vec(np.array([[start_lat], [end_lat]]), np.array([[start_lng], [end_lng]]),
+                               self._road_coords[:, 0], self._road_coords[:, 1], self._road_cos_lat)
+        start_idx, end_idx = np.argmin(dists, axis=1)
         
-        # Add waypoints if roads are found
-        if closest_start_road and min_start_dist < 20:  # Within 20km
-            waypoints.append([closest_start_road[1], closest_start_road[0]])
+        # Add waypoints if roads are close enough
+        if dists[0, start_idx] < ROAD_SNAP_MAX_KM:
+            start_road = self._road_points[start_idx]
+            waypoints.append([start_road[1], start_road[0]])
         
-        if closest_end_road and min_end_dist < 20:  # Within 20km
-            waypoints.append([closest_end_road[1], closest_end_road[0]])
+        if dists[1, end_idx] < ROAD_SNAP_MAX_KM:
+            end_road = self._road_points[end_idx]
+            waypoints.append([end_road[1], end_road[0]])
         
         return waypoints
     
@@ -182,32 +471,20 @@ class EvacuationRouteMapper:
         if not route_geometry:
             return 0.5
         
-        # Check how much of the route is outside the risk zone
-        safe_points = 0
-        total_points = len(route_geometry)
-        
-        for point in route_geometry:
-            point_distance = self.calculate_distance(fire_lat, fire_lng, point[1], point[0])
-            if point_distance > risk_radius:
-                safe_points += 1
-        
-        base_safety = safe_points / total_points if total_points > 0 else 0
-        
-        # Add bonus for routes that quickly exit risk zone
-        if len(route_geometry) > 2:
-            early_exit_dist = self.calculate_distance(
-                fire_lat, fire_lng, 
-                route_geometry[len(route_geometry)//4][1], 
-                route_geometry[len(route_geometry)//4][0]
-            )
-            if early_exit_dist > risk_radius:
-                base_safety += 0.2
-        
-        return min(1.0, base_safety)
+        # Check how much of the route is outside the risk zone in one pass over the vertices
+        return _safety_kernel(np.asarray(route_geometry, dtype=np.float64), fire_lat, fire_lng, risk_radius)
     
-    def generate_evacuation_routes(self, fire_lat: float, fire_lng: float, 
-                                  risk_radius: float) -> List[Dict]:
-        """Generate multiple evacuation routes from fire location"""
+    def _scored_route(self, fire_lat: float, fire_lng: float, zone: SafeZone,
+                      risk_radius: float) -> Tuple[Dict, float]:
+        """Generate the route to a safe zone and score it while its geometry is at hand"""
+        route_data = self.generate_route_via_osm(fire_lat, fire_lng, zone.lat, zone.lng)
+        if not route_data['success']:
+            return route_data, 0.0
+        return route_data, self.calculate_safety_score(route_data['geometry'], fire_lat, fire_lng, risk_radius)
+    
+    def plan_evacuation_routes(self, fire_lat: float, fire_lng: float, 
+                               risk_radius: float) -> List[EvacuationRoute]:
+        """Generate multiple evacuation routes from fire location as EvacuationRoute objects"""
         safe_zones = self.find_nearest_safe_zones(fire_lat, fire_lng, risk_radius)
         
         if not safe_zones:
@@ -215,61 +492,44 @@ class EvacuationRouteMapper:
         
         evacuation_routes = []
         
-        for i, zone in enumerate(safe_zones):
-            # Generate route to this safe zone
-            route_data = self.generate_route_via_osm(fire_lat, fire_lng, zone.lat, zone.lng)
-            
+        # Generate and score routes to all safe zones at once; map keeps the zone order
+        scored_routes = self._route_pool.map(
+            lambda zone: self._scored_route(fire_lat, fire_lng, zone, risk_radius),
+            safe_zones
+        )
+        
+        for i, (zone, (route_data, safety_score)) in enumerate(zip(safe_zones, scored_routes)):
             if route_data['success']:
-                safety_score = self.calculate_safety_score(
-                    route_data['geometry'], fire_lat, fire_lng, risk_radius
-                )
-                
-                route_type = 'primary' if i == 0 else 'secondary' if i < 3 else 'emergency'
-                
-                evacuation_route = {
-                    'route_id': f"evac_route_{i+1}",
-                    'destination': {
-                        'name': zone.name,
-                        'type': zone.type,
-                        'capacity': zone.capacity,
-                        'facilities': zone.facilities,
-                        'coordinates': [zone.lat, zone.lng]
-                    },
-                    'geometry': route_data['geometry'],
-                    'distance_km': round(route_data['distance'], 2),
-                    'estimated_time_minutes': round(route_data['duration'], 0),
-                    'safety_score': round(safety_score, 2),
-                    'route_type': route_type,
-                    'instructions': route_data['steps'],
-                    'color': self.get_route_color(route_type),
-                    'priority': i + 1
-                }
-                
-                evacuation_routes.append(evacuation_route)
+                evacuation_routes.append(EvacuationRoute(
+                    route_id=f"evac_route_{i+1}",
+                    destination=zone,
+                    geometry=route_data['geometry'],
+                    distance_km=route_data['distance'],
+                    estimated_time_minutes=route_data['duration'],
+                    safety_score=safety_score,
+                    route_type='primary' if i == 0 else 'secondary' if i < 3 else 'emergency',
+                    instructions=route_data['steps'],
+                    priority=i + 1
+                ))
         
         return evacuation_routes
     
+    def generate_evacuation_routes(self, fire_lat: float, fire_lng: float, 
+                                  risk_radius: float) -> List[Dict]:
+        """Generate multiple evacuation routes from fire location"""
+        return [route.to_dict() for route in self.plan_evacuation_routes(fire_lat, fire_lng, risk_radius)]
+    
     def get_route_color(self, route_type: str) -> str:
         """Get color code for route visualization"""
-        colors = {
-            'primary': '#10b981',    # Green
-            'secondary': '#f59e0b',  # Yellow
-            'emergency': '#ef4444'   # Red
-        }
-        return colors.get(route_type, '#6b7280')
+        return ROUTE_COLORS.get(route_type, '#6b7280')
     
     def get_safe_zones(self) -> List[Dict]:
-        """Get all available safe zones"""
-        return [
-            {
-                'name': zone.name,
-                'coordinates': [zone.lat, zone.lng],
-                'capacity': zone.capacity,
-                'type': zone.type,
-                'facilities': zone.facilities
-            }
-            for zone in self.safe_zones
-        ]
+        """Get all available safe zones (shared list, treat as read-only)"""
+        return self._zones_payload
+    
+    def get_safe_zones_json(self) -> bytes:
+        """Get the pre-encoded safe zones API response"""
+        return self._zones_json
 
 # Global evacuation system instance
 evacuation_system = EvacuationRouteMapper()
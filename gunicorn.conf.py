@@ -0,0 +1,15 @@
+
+# Gunicorn configuration for the NeuroNix alert system (see wsgi.py)
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5002')
+
+# Alert state and the monitoring thread live in-process, so a single worker
+# process serves all requests; concurrency comes from its thread pool
+workers = 1
+worker_class = 'gthread'
+threads = 32
+
+# Keep connections from polling field dashboards open between refreshes
+keepalive = 30
+timeout = 60
@@ -0,0 +1,71 @@
+
+from flask.json.provider import DefaultJSONProvider
+import json
+import numpy as np
+
+# orjson integration (optional: pip install orjson); falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _orjson_options(sort_keys: bool) -> int:
+    """orjson flags matching Flask's default JSON output"""
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    return options
+
+
+def _numpy_default(o):
+    """Stdlib json fallback for NumPy scalars and arrays"""
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    if isinstance(o, np.generic):
+        return o.item()
+    return DefaultJSONProvider.default(o)
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    """Stdlib Flask JSON provider that also accepts NumPy values"""
+
+    default = staticmethod(_numpy_default)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=_orjson_options(self.sort_keys)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response directly from orjson bytes, skipping the str round-trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        payload = orjson.dumps(obj, default=self.default, option=_orjson_options(self.sort_keys))
+        return self._app.response_class(payload, mimetype=self.mimetype)
+
+
+def install_json_provider(app):
+    """Use orjson for jsonify and request.get_json when it is installed"""
+    app.json = ORJSONProvider(app) if ORJSON_AVAILABLE else NumpyJSONProvider(app)
+    return app
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes for pre-built responses"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_orjson_options(True))
+    return json.dumps(obj, default=_numpy_default, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def request_json(req):
+    """Parse a request body as JSON straight from its bytes; an empty body parses as {}"""
+    body = req.get_data(cache=False)
+    if not body:
+        return {}
+    return orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
@@ -1,34 +1,77 @@
 
-from flask import Flask, send_from_directory, jsonify
+from flask import Flask, Response, send_from_directory, request
 from flask_cors import CORS
+from json_provider import dumps_bytes
 import os
 
-app = Flask(__name__, static_folder='.')
+# Static assets are served by Flask's built-in static route at the site root
+app = Flask(__name__, static_folder='.', static_url_path='')
+# Let browsers cache CSS/JS/images for a day
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400
+# Behind a front-end server that honours X-Sendfile, hand file bodies off to it
+app.use_x_sendfile = os.getenv('USE_X_SENDFILE') == '1'
 CORS(app)
 
+def file_etag(path):
+    """ETag built from a file's mtime and size"""
+    st = os.stat(path)
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+def scan_static_etags(root):
+    """Map every static file (URL path) to its ETag"""
+    etags = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            etags[os.path.relpath(path, root).replace(os.sep, '/')] = file_etag(path)
+    return etags
+
+# Static files found at startup and their last-seen ETags
+STATIC_ETAGS = scan_static_etags(app.static_folder)
+
+def send_static(filename):
+    """Send a static file, answering matching If-None-Match with 304 without reading the file"""
+    etag = None
+    if filename in STATIC_ETAGS:
+        # Re-stat so a file edited while the server runs gets a new ETag
+        try:
+            etag = STATIC_ETAGS[filename] = file_etag(os.path.join(app.static_folder, filename))
+        except OSError:
+            STATIC_ETAGS.pop(filename, None)
+    if etag and request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = app.get_send_file_max_age(filename)
+        return response
+    return send_from_directory(app.static_folder, filename, etag=etag or True, conditional=True)
+
+app.view_functions['static'] = send_static
+
 @app.route('/')
 def index():
     """Serve the main dashboard"""
-    return send_from_directory('.', 'index.html')
+    return send_static('index.html')
 
-@app.route('/<path:filename>')
-def static_files(filename):
-    """Serve static files (CSS, JS, etc.)"""
-    return send_from_directory('.', filename)
+# The health payload never changes, so serialize it once
+_HEALTH_BYTES = dumps_bytes({
+    'status': 'healthy',
+    'message': 'NeuroNix Forest Fire Prediction System',
+    'services': {
+        'main_dashboard': 'running',
+        'ml_api': 'port 5001',
+        'alert_system': 'port 5002'
+    }
+})
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'message': 'NeuroNix Forest Fire Prediction System',
-        'services': {
-            'main_dashboard': 'running',
-            'ml_api': 'port 5001',
-            'alert_system': 'port 5002'
-        }
-    })
+    return Response(_HEALTH_BYTES, mimetype='application/json')
 
 if __name__ == '__main__':
+    # Threaded development server without the debug reloader.
+    # For production use gunicorn: gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5000 main_server:app
     print("🌐 Starting NeuroNix Main Dashboard on port 5000...")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, threaded=True)
@@ -1,15 +1,71 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import json
+import math
 import numpy as np
 from datetime import datetime
-from ml_models import get_model_predictions, simulate_fire_scenario, NDVIAnalyzer
+from ml_models import get_model_predictions, simulate_fire_scenario, NDVIAnalyzer, latlng_to_grid
+from json_provider import install_json_provider, dumps_bytes, request_json
+import itertools
+import os
+import queue
 import threading
 import time
-from typing import Dict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# Response compression (optional: pip install flask-compress)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
 
 app = Flask(__name__)
 CORS(app)
+install_json_provider(app)
+
+# gzip JSON bodies over 1 KB, e.g. /api/ml/model-info and /api/ml/realtime
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+
+class TimestampCache:
+    """Second-resolution ISO timestamp shared by all requests within the same second"""
+
+    def __init__(self):
+        self._second = None
+        self._iso = ''
+        self._lock = threading.Lock()
+
+    def now(self) -> str:
+        """Current local time as an ISO string, formatted at most once per second"""
+        second = int(time.time())
+        if second != self._second:
+            with self._lock:
+                if second != self._second:
+                    self._iso = datetime.fromtimestamp(second).isoformat()
+                    self._second = second
+        return self._iso
+
+ts_cache = TimestampCache()
+
+# Per-thread PCG64 generators for the synthetic data, spawned from one SeedSequence
+# so request threads never share (and contend on) a bit generator
+_seed_seq = np.random.SeedSequence()
+_seed_lock = threading.Lock()
+_rng_tls = threading.local()
+
+def _rng() -> np.random.Generator:
+    """This thread's random generator"""
+    generator = getattr(_rng_tls, 'generator', None)
+    if generator is None:
+        with _seed_lock:
+            child = _seed_seq.spawn(1)[0]
+        generator = _rng_tls.generator = np.random.default_rng(child)
+    return generator
 
 # Import alert system
 try:
@@ -39,14 +95,67 @@ except ImportError:
 # Assuming FireRiskPredictor is defined in ml_models.py
 # For demonstration purposes, we'll assume it's available.
 # In a real scenario, you would import it like: from ml_models import FireRiskPredictor
+# Columns of the (N x 4) arrays taken by the batch predictor, with their defaults
+BATCH_FEATURES = ('temperature', 'humidity', 'wind_speed', 'ndvi')
+BATCH_DEFAULTS = (30, 50, 15, 0.6)
+BATCH_SCHEMA = tuple(zip(BATCH_FEATURES, BATCH_DEFAULTS))
+
+# Every /api/ml/predict input with its default, in response order
+ENV_SCHEMA = (
+    ('temperature', 30),
+    ('humidity', 50),
+    ('wind_speed', 15),
+    ('wind_direction', 'NE'),
+    ('ndvi', 0.6),
+    ('elevation', 1500),
+    ('slope', 15),
+    ('vegetation_density', 'moderate')
+)
+
+def env_matrix(samples: List[Dict]) -> np.ndarray:
+    """Stack environmental dicts into an (N x 4) float64 array of BATCH_FEATURES"""
+    return np.array([
+        [sample.get(feature, default) for feature, default in BATCH_SCHEMA]
+        for sample in samples
+    ], dtype=np.float64).reshape(-1, len(BATCH_FEATURES))
+
+def features_matrix(rows) -> np.ndarray:
+    """Columnar feature rows as an (N x 4) float64 array of BATCH_FEATURES, or None if they don't form one"""
+    try:
+        features = np.asarray(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if features.size == 0:
+        return features.reshape(0, len(BATCH_FEATURES))
+    if features.ndim != 2 or features.shape[1] != len(BATCH_FEATURES):
+        return None
+    return features
+
 class MockFireRiskPredictor:
     def predict_comprehensive_risk(self, environmental_data: Dict) -> Dict:
-        # Mock prediction logic
+        # Mock prediction logic (scalar math is cheaper than NumPy for a single sample)
         risk_score = (environmental_data.get('temperature', 30) / 50) * 0.7 + \
                      (1 - environmental_data.get('humidity', 50) / 100) * 0.2 + \
                      (environmental_data.get('wind_speed', 15) / 30) * 0.1
+        return self._prediction_dict(min(1.0, risk_score))
+    
+    def predict_batch(self, env_array: np.ndarray) -> np.ndarray:
+        """Ensemble risk scores for an (N x 4) array of BATCH_FEATURES in one vectorized pass (float32 in, float32 out)"""
+        env_array = np.asarray(env_array)
+        if env_array.dtype != np.float32:
+            env_array = env_array.astype(np.float64, copy=False)
+        risk_scores = (env_array[:, 0] / 50) * 0.7 + \
+                      (1 - env_array[:, 1] / 100) * 0.2 + \
+                      (env_array[:, 2] / 30) * 0.1
+        return np.minimum(1.0, risk_scores)
+    
+    def predict_comprehensive_risk_batch(self, env_array: np.ndarray) -> List[Dict]:
+        """predict_comprehensive_risk for every row of an (N x 4) array of BATCH_FEATURES"""
+        return [self._prediction_dict(risk_score) for risk_score in self.predict_batch(env_array).tolist()]
+    
+    def _prediction_dict(self, risk_score: float) -> Dict:
         return {
-            'ensemble_risk_score': min(1.0, risk_score),
+            'ensemble_risk_score': risk_score,
             'fire_probability': 0.6,
             'spread_rate': 2.5,
             'burn_intensity': 3.0
@@ -57,8 +166,8 @@ class MockFireRiskPredictor:
         lat, lng = grid_coords
         return {
             'fire_perimeter': f"Simulated perimeter around {lat},{lng}",
-            'burned_area_sq_km': np.random.uniform(1, 20),
-            'fire_intensity': np.random.uniform(2, 5)
+            'burned_area_sq_km': _rng().uniform(1, 20),
+            'fire_intensity': _rng().uniform(2, 5)
         }
 
 fire_predictor = MockFireRiskPredictor()
@@ -68,21 +177,201 @@ def get_model_predictions(environmental_data: Dict) -> Dict:
     """Main function to get comprehensive fire risk predictions"""
     return fire_predictor.predict_comprehensive_risk(environmental_data)
 
+def get_model_predictions_batch(environmental_data: List[Dict]) -> List[Dict]:
+    """Comprehensive fire risk predictions for several samples at once"""
+    return fire_predictor.predict_comprehensive_risk_batch(env_matrix(environmental_data))
+
 def simulate_fire_scenario(lat: float, lng: float, env_data: Dict) -> Dict:
     """Simulate fire spread scenario at given coordinates"""
-    # Convert lat/lng to grid coordinates (simplified)
-    grid_x = int((lat - 29.0) * 50)  # Rough conversion for Uttarakhand region
-    grid_y = int((lng - 79.0) * 50)
-
-    # Ensure coordinates are within grid bounds
-    grid_x = max(0, min(99, grid_x))
-    grid_y = max(0, min(99, grid_y))
-
-    return fire_predictor.simulate_fire_spread((grid_x, grid_y), env_data)
-
+    return fire_predictor.simulate_fire_spread(latlng_to_grid(lat, lng), env_data)
+
+class PredictBatcher:
+    """Coalesces concurrent single-sample predictions into micro-batches
+    
+    Requests wait until MAX_BATCH samples are queued or MAX_WAIT_MS has passed since
+    the first one arrived, then the whole batch is scored with one predict_batch call.
+    """
+
+    def __init__(self, max_batch: int = 64, max_wait_ms: float = 2.0):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, env_data: Dict) -> Future:
+        """Queue one sample; the future resolves to its predict_comprehensive_risk dict"""
+        return self.submit_vector(env_matrix([env_data])[0])
+
+    def submit_vector(self, vector: np.ndarray) -> Future:
+        """Queue one BATCH_FEATURES row; the future resolves to its predict_comprehensive_risk dict"""
+        if self._worker is None:
+            self._start()
+        future = Future()
+        self._queue.put((vector, future))
+        return future
+
+    def predict(self, env_data: Dict) -> Dict:
+        """Predict one sample through the batch queue"""
+        return self.submit(env_data).result()
+
+    def _start(self):
+        """Start the worker on first use (after any server fork)"""
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._batch_loop, name='predict-batcher', daemon=True)
+                self._worker.start()
+
+    def _batch_loop(self):
+        """Drain the queue into batches and resolve their futures"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            vectors, futures = zip(*batch)
+            try:
+                predictions = fire_predictor.predict_comprehensive_risk_batch(np.vstack(vectors))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            for future, prediction in zip(futures, predictions):
+                future.set_result(prediction)
+
+predict_batcher = PredictBatcher(
+    max_batch=int(os.getenv('ML_PREDICT_MAX_BATCH', '64')),
+    max_wait_ms=float(os.getenv('ML_PREDICT_MAX_WAIT_MS', '2'))
+)
+
+@lru_cache(maxsize=4096)
+def _cached_predict(temperature, humidity, wind_speed, ndvi) -> Dict:
+    """Prediction for one BATCH_FEATURES tuple; repeated inputs skip the batcher entirely"""
+    vector = np.array((temperature, humidity, wind_speed, ndvi), dtype=np.float64)
+    return predict_batcher.submit_vector(vector).result()
+
+# Baseline conditions per region, as arrays so a tick's data is drawn in bulk
+REGIONS = ['Nainital', 'Almora', 'Dehradun', 'Haridwar', 'Rishikesh']
+REGION_INDEX = {region: i for i, region in enumerate(REGIONS)}
+ALL_REGIONS_IDX = np.arange(len(REGIONS), dtype=np.intp)
+UNKNOWN_REGION_IDX = len(REGIONS)
+WIND_DIRECTIONS = np.array(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'])
+VEGETATION_DENSITIES = np.array(['moderate', 'dense', 'sparse'])
+VEGETATION_P = [0.5, 0.3, 0.2]
+
+# Numeric fields of a region's environmental data; the first four are BATCH_FEATURES
+NUMERIC_FIELDS = BATCH_FEATURES + ('elevation', 'slope')
+
+# Generator constants, partially evaluated per region at import. Field j of a tick is
+# clip(NUMERIC_OFFSET[region, j] + NUMERIC_SCALE[j] * noise, NUMERIC_LOW[j], NUMERIC_HIGH[j])
+#                           temperature humidity wind_speed ndvi elevation slope
+NUMERIC_OFFSET = np.array([[28,         45,      18,        0.6, 1500,     15],   # Nainital
+                           [26,         50,      15,        0.6, 1500,     15],   # Almora
+                           [30,         55,      12,        0.6, 1500,     15],   # Dehradun
+                           [32,         60,      10,        0.6, 1500,     15],   # Haridwar
+                           [29,         52,      14,        0.6, 1500,     15],   # Rishikesh
+                           [28,         50,      15,        0.6, 1500,     15]],  # unknown region
+                          dtype=np.float32)
+NUMERIC_SCALE = np.array([3, 8, 5, 0.1, 300, 8], dtype=np.float32)
+NUMERIC_LOW = np.array([15, 20, 5, 0.2, -np.inf, 0], dtype=np.float32)
+NUMERIC_HIGH = np.array([np.inf, 80, np.inf, 0.9, np.inf, 45], dtype=np.float32)
+
+# Relative change in any BATCH_FEATURES input that triggers a region's re-prediction
+ENV_CHANGE_THRESHOLD = 0.02
+
+@dataclass
+class RegionState:
+    """Struct-of-arrays snapshot of the realtime predictions, one row per entry of REGIONS
+
+    Numeric columns are float32 end to end; /api/ml/realtime reports those float32 values as JSON numbers.
+    """
+    numeric: np.ndarray             # (n_regions x 6) NUMERIC_FIELDS behind each prediction
+    wind_direction: np.ndarray
+    vegetation_density: np.ndarray
+    risks: np.ndarray
+    timestamps: List[str]
+    valid: np.ndarray               # regions that have been predicted at least once
+    _dict: Optional[Dict] = field(default=None, repr=False)
+
+    @classmethod
+    def empty(cls, n_regions: int) -> 'RegionState':
+        """State with no predictions yet"""
+        return cls(
+            numeric=np.zeros((n_regions, len(NUMERIC_FIELDS)), dtype=np.float32),
+            wind_direction=np.full(n_regions, '', dtype=WIND_DIRECTIONS.dtype),
+            vegetation_density=np.full(n_regions, '', dtype=VEGETATION_DENSITIES.dtype),
+            risks=np.zeros(n_regions, dtype=np.float32),
+            timestamps=[''] * n_regions,
+            valid=np.zeros(n_regions, dtype=bool)
+        )
 
-# Global variables for real-time data simulation
-current_predictions = {}
+    @property
+    def env(self) -> np.ndarray:
+        """(n_regions x 4) BATCH_FEATURES view of the numeric columns"""
+        return self.numeric[:, :len(BATCH_FEATURES)]
+
+    def updated(self, rows: np.ndarray, numeric: np.ndarray, wind_direction: np.ndarray,
+                vegetation_density: np.ndarray, risks: np.ndarray, timestamp: str) -> 'RegionState':
+        """Copy of this state with the given rows replaced by a fresh tick"""
+        state = RegionState(
+            numeric=self.numeric.copy(),
+            wind_direction=self.wind_direction.copy(),
+            vegetation_density=self.vegetation_density.copy(),
+            risks=self.risks.copy(),
+            timestamps=list(self.timestamps),
+            valid=self.valid.copy()
+        )
+        state.numeric[rows] = numeric[rows]
+        state.wind_direction[rows] = wind_direction[rows]
+        state.vegetation_density[rows] = vegetation_density[rows]
+        state.risks[rows] = risks
+        state.valid[rows] = True
+        for i in rows.tolist():
+            state.timestamps[i] = timestamp
+        return state
+
+    def to_dict(self) -> Dict:
+        """Region -> {prediction, timestamp, environmental_data}, built once per snapshot"""
+        if self._dict is None:
+            rows = np.flatnonzero(self.valid).tolist()
+            numeric = self.numeric.tolist()
+            wind_direction = self.wind_direction.tolist()
+            vegetation_density = self.vegetation_density.tolist()
+            risks = self.risks.tolist()
+            self._dict = {
+                REGIONS[i]: {
+                    'prediction': fire_predictor._prediction_dict(risks[i]),
+                    'timestamp': self.timestamps[i],
+                    'environmental_data': regional_dict(numeric[i], wind_direction[i], vegetation_density[i])
+                }
+                for i in rows
+            }
+        return self._dict
+
+def regional_dict(numeric: List[float], wind_direction: str, vegetation_density: str) -> Dict:
+    """Environmental data dict for one region from its NUMERIC_FIELDS row and categorical fields"""
+    temperature, humidity, wind_speed, ndvi, elevation, slope = numeric
+    return {
+        'temperature': temperature,
+        'humidity': humidity,
+        'wind_speed': wind_speed,
+        'wind_direction': wind_direction,
+        'ndvi': ndvi,
+        'elevation': elevation,
+        'slope': slope,
+        'vegetation_density': vegetation_density
+    }
+
+# Global variables for real-time data simulation; region_state is an
+# immutable snapshot that the prediction loop replaces wholesale each tick
+region_state = RegionState.empty(len(REGIONS))
 simulation_cache = {}
 
 class RealTimePredictor:
@@ -91,107 +380,178 @@ class RealTimePredictor:
     def __init__(self):
         self.is_running = False
         self.prediction_thread = None
+        self._stop_evt = threading.Event()
 
     def start_continuous_prediction(self):
         """Start continuous prediction updates"""
         if not self.is_running:
             self.is_running = True
+            self._stop_evt.clear()
             self.prediction_thread = threading.Thread(target=self._prediction_loop)
             self.prediction_thread.daemon = True
             self.prediction_thread.start()
 
+    def stop(self):
+        """Stop continuous prediction updates, waking the loop if it is waiting"""
+        self.is_running = False
+        self._stop_evt.set()
+
     def _prediction_loop(self):
         """Main prediction loop running in background"""
-        regions = ['Nainital', 'Almora', 'Dehradun', 'Haridwar', 'Rishikesh']
+        global region_state
+        regions = REGIONS
 
-        while self.is_running:
+        while not self._stop_evt.is_set():
             try:
-                for region in regions:
-                    # Simulate environmental data for each region
-                    env_data = self._generate_regional_data(region)
+                # Simulate environmental data for every region in one draw
+                numeric, wind_direction, vegetation_density = self._generate_all()
+                env = numeric[:, :len(BATCH_FEATURES)]
+
+                # Only re-predict regions whose inputs moved beyond the threshold
+                state = region_state
+                rel_change = np.abs(env - state.env) / np.maximum(np.abs(state.env), 1e-9)
+                changed = np.flatnonzero(~state.valid | (rel_change.max(axis=1) > ENV_CHANGE_THRESHOLD))
+
+                if changed.size:
+                    # Get ML risk scores for the changed regions in one batch
+                    risks = fire_predictor.predict_batch(env[changed])
 
-                    # Get ML predictions
-                    predictions = get_model_predictions(env_data)
+                    # Build the tick off to the side, then publish it in one assignment
+                    region_state = state.updated(changed, numeric, wind_direction, vegetation_density,
+                                                 risks, ts_cache.now())
 
-                    # Store predictions
-                    current_predictions[region] = {
-                        'prediction': predictions,
-                        'timestamp': datetime.now().isoformat(),
-                        'environmental_data': env_data
-                    }
+                    # Wake the alert monitor with the fresh scores
+                    if ALERT_SYSTEM_AVAILABLE:
+                        for i, risk_score in zip(changed.tolist(), risks.tolist()):
+                            alert_system.push_score(regions[i], risk_score)
 
-                # Update every 30 seconds
-                time.sleep(30)
+                # Update every 30 seconds, returning at once on stop()
+                self._stop_evt.wait(30)
 
             except Exception as e:
                 print(f"Error in prediction loop: {e}")
-                time.sleep(10)
+                self._stop_evt.wait(10)
 
     def _generate_regional_data(self, region: str) -> dict:
         """Generate realistic environmental data for a region"""
-        base_conditions = {
-            'Nainital': {'temp_base': 28, 'humidity_base': 45, 'wind_base': 18},
-            'Almora': {'temp_base': 26, 'humidity_base': 50, 'wind_base': 15},
-            'Dehradun': {'temp_base': 30, 'humidity_base': 55, 'wind_base': 12},
-            'Haridwar': {'temp_base': 32, 'humidity_base': 60, 'wind_base': 10},
-            'Rishikesh': {'temp_base': 29, 'humidity_base': 52, 'wind_base': 14}
-        }
+        return self._generate_regional_batch([region])[0]
+
+    def _generate_regional_batch(self, regions: List[str]) -> List[dict]:
+        """Generate realistic environmental data for several regions as a list of dicts"""
+        idx = np.array([REGION_INDEX.get(region, UNKNOWN_REGION_IDX) for region in regions], dtype=np.intp)
+        numeric, wind_direction, vegetation_density = self._generate_all(idx)
+        return [regional_dict(*row) for row in zip(numeric.tolist(), wind_direction.tolist(), vegetation_density.tolist())]
 
-        base = base_conditions.get(region, {'temp_base': 28, 'humidity_base': 50, 'wind_base': 15})
+    def _generate_all(self, idx: np.ndarray = ALL_REGIONS_IDX):
+        """Generate realistic environmental data for the given region ids from one bulk RNG draw
+
+        Returns the (len(idx) x 6) float32 NUMERIC_FIELDS matrix plus the wind direction
+        and vegetation density arrays.
+        """
+        rng = _rng()
+        noise = rng.standard_normal((len(idx), len(NUMERIC_FIELDS)), dtype=np.float32)
 
         # Add realistic variations
-        return {
-            'temperature': max(15, base['temp_base'] + np.random.normal(0, 3)),
-            'humidity': max(20, min(80, base['humidity_base'] + np.random.normal(0, 8))),
-            'wind_speed': max(5, base['wind_base'] + np.random.normal(0, 5)),
-            'wind_direction': np.random.choice(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']),
-            'ndvi': max(0.2, min(0.9, 0.6 + np.random.normal(0, 0.1))),
-            'elevation': 1500 + np.random.normal(0, 300),
-            'slope': max(0, min(45, 15 + np.random.normal(0, 8))),
-            'vegetation_density': np.random.choice(['moderate', 'dense', 'sparse'], p=[0.5, 0.3, 0.2])
-        }
+        numeric = NUMERIC_OFFSET[idx]
+        numeric += NUMERIC_SCALE * noise
+        np.clip(numeric, NUMERIC_LOW, NUMERIC_HIGH, out=numeric)
+        wind_direction = rng.choice(WIND_DIRECTIONS, size=len(idx))
+        vegetation_density = rng.choice(VEGETATION_DENSITIES, size=len(idx), p=VEGETATION_P)
+        return numeric, wind_direction, vegetation_density
 
 # Initialize real-time predictor
 real_time_predictor = RealTimePredictor()
 
+def get_current_predictions() -> Dict:
+    """Return the latest published predictions as region -> dict (treat as read-only)"""
+    return region_state.to_dict()
+
+class AlertDispatcher:
+    """Hands alert triggers to one background thread so request handlers never wait on the alert system
+
+    The worker drains up to MAX_BATCH queued triggers at a time and keeps only the highest
+    score per (region, risk_level) before calling alert_system._trigger_alert.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_batch: int = 64):
+        self.max_batch = max_batch
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, region: str, risk_level: str, risk_score: float):
+        """Queue one alert trigger without blocking; drops it if the queue is full"""
+        if self._worker is None:
+            self._start()
+        try:
+            self._queue.put_nowait((region, risk_level, risk_score))
+        except queue.Full:
+            self.dropped += 1
+            print(f"Alert queue full, dropped alert for {region}")
+
+    def _start(self):
+        """Start the worker on first use (after any server fork)"""
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._dispatch_loop, name='alert-dispatcher', daemon=True)
+                self._worker.start()
+
+    def _dispatch_loop(self):
+        """Drain the queue in batches, coalesce duplicates and trigger the alerts"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            latest = {}
+            for region, risk_level, risk_score in batch:
+                key = (region, risk_level)
+                if risk_score >= latest.get(key, risk_score):
+                    latest[key] = risk_score
+
+            for (region, risk_level), risk_score in latest.items():
+                try:
+                    alert_system._trigger_alert(region, risk_level, risk_score)
+                except Exception as e:
+                    print(f"Failed to trigger alert: {e}")
+
+alert_dispatcher = AlertDispatcher()
+
+def trigger_alert_if_high(region: str, predictions: Dict):
+    """Queue an alert through the alert system when the ensemble risk is above 0.7"""
+    if ALERT_SYSTEM_AVAILABLE and predictions.get('ensemble_risk_score', 0) > 0.7:
+        risk_score = predictions['ensemble_risk_score']
+        risk_level = 'very-high' if risk_score > 0.85 else 'high'
+
+        # Trigger alert through alert system, off the request thread
+        alert_dispatcher.submit(region, risk_level, risk_score)
+
 @app.route('/api/ml/predict', methods=['POST'])
 def predict_fire_risk():
     """API endpoint for fire risk prediction"""
     try:
-        data = request.get_json()
+        data = request_json(request)
 
-        # Extract environmental parameters
-        env_data = {
-            'temperature': data.get('temperature', 30),
-            'humidity': data.get('humidity', 50),
-            'wind_speed': data.get('wind_speed', 15),
-            'wind_direction': data.get('wind_direction', 'NE'),
-            'ndvi': data.get('ndvi', 0.6),
-            'elevation': data.get('elevation', 1500),
-            'slope': data.get('slope', 15),
-            'vegetation_density': data.get('vegetation_density', 'moderate')
-        }
+        # Get ML predictions straight from the model inputs: cached for repeated
+        # inputs, otherwise batched with concurrent requests
+        features = [data.get(feature, default) for feature, default in BATCH_SCHEMA]
+        predictions = dict(_cached_predict(*features))
 
-        # Get ML predictions
-        predictions = get_model_predictions(env_data)
+        # Environmental parameters, echoed back in the response
+        env_data = {key: data.get(key, default) for key, default in ENV_SCHEMA}
 
         # Check if alert should be triggered
-        if ALERT_SYSTEM_AVAILABLE and predictions.get('ensemble_risk_score', 0) > 0.7:
-            region = data.get('region', 'Unknown Region')
-            risk_score = predictions['ensemble_risk_score']
-            risk_level = 'very-high' if risk_score > 0.85 else 'high'
-
-            # Trigger alert through alert system
-            try:
-                alert_system._trigger_alert(region, risk_level, risk_score)
-            except Exception as e:
-                print(f"Failed to trigger alert: {e}")
+        trigger_alert_if_high(data.get('region', 'Unknown Region'), predictions)
 
         return jsonify({
             'success': True,
             'predictions': predictions,
             'input_data': env_data,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts_cache.now(),
             'alert_triggered': ALERT_SYSTEM_AVAILABLE and predictions.get('ensemble_risk_score', 0) > 0.7
         })
 
@@ -201,11 +561,60 @@ def predict_fire_risk():
             'error': str(e)
         }), 500
 
+@app.route('/api/ml/predict_batch', methods=['POST'])
+def predict_fire_risk_batch():
+    """API endpoint for fire risk prediction on a list of samples
+
+    Accepts either a list of environmental dicts, or a columnar body
+    {"features": [[temperature, humidity, wind_speed, ndvi], ...], "regions": [...]}
+    whose rows go straight into the predictor as one array.
+    """
+    try:
+        data = request_json(request)
+
+        # Get ML predictions for all samples in one vectorized pass
+        if isinstance(data, dict):
+            features = features_matrix(data.get('features', []))
+            if features is None:
+                return jsonify({
+                    'success': False,
+                    'error': f"'features' must be rows of {len(BATCH_FEATURES)} numbers ({', '.join(BATCH_FEATURES)})"
+                }), 400
+            regions = data.get('regions') or ['Unknown Region'] * len(features)
+            if len(regions) != len(features):
+                return jsonify({
+                    'success': False,
+                    'error': f"'regions' has {len(regions)} entries for {len(features)} feature rows"
+                }), 400
+            predictions = fire_predictor.predict_comprehensive_risk_batch(features)
+        else:
+            predictions = get_model_predictions_batch(data)
+            regions = [sample.get('region', 'Unknown Region') for sample in data]
+
+        alerts_triggered = []
+        for region, prediction in zip(regions, predictions):
+            trigger_alert_if_high(region, prediction)
+            alerts_triggered.append(ALERT_SYSTEM_AVAILABLE and prediction['ensemble_risk_score'] > 0.7)
+
+        return jsonify({
+            'success': True,
+            'predictions': predictions,
+            'count': len(predictions),
+            'timestamp': ts_cache.now(),
+            'alerts_triggered': alerts_triggered
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/ml/simulate', methods=['POST'])
 def simulate_fire():
     """API endpoint for fire spread simulation"""
     try:
-        data = request.get_json()
+        data = request_json(request)
 
         # Extract coordinates and environmental data
         lat = data.get('lat', 30.0)
@@ -241,7 +650,7 @@ def simulate_fire():
                 'environmental_data': env_data
             },
             'environmental_impact': environmental_impact,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts_cache.now()
         })
 
     except Exception as e:
@@ -255,20 +664,21 @@ def get_realtime_predictions():
     """Get real-time predictions for all regions"""
     try:
         region = request.args.get('region', 'all')
+        snap = get_current_predictions()
 
         if region == 'all':
             return jsonify({
                 'success': True,
-                'predictions': current_predictions,
-                'timestamp': datetime.now().isoformat()
+                'predictions': snap,
+                'timestamp': ts_cache.now()
             })
         else:
-            region_data = current_predictions.get(region, {})
+            region_data = snap.get(region, {})
             return jsonify({
                 'success': True,
                 'prediction': region_data,
                 'region': region,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': ts_cache.now()
             })
 
     except Exception as e:
@@ -277,17 +687,89 @@ def get_realtime_predictions():
             'error': str(e)
         }), 500
 
+def _synthesize_ndvi(rng: np.random.Generator, ndvi_before: np.ndarray, ndvi_after: np.ndarray, scratch: np.ndarray):
+    """Fill float32 before/after buffers with synthetic pre/post-fire NDVI imagery"""
+    # Healthy vegetation: Beta(3, 2) drawn in place as G3 / (G3 + G2)
+    rng.standard_gamma(3, out=ndvi_before, dtype=np.float32)
+    rng.standard_gamma(2, out=scratch, dtype=np.float32)
+    scratch += ndvi_before
+    ndvi_before /= scratch
+
+    # After potential fire: subtract Exponential(0.1) damage
+    rng.standard_exponential(out=scratch, dtype=np.float32)
+    scratch *= 0.1
+    np.subtract(ndvi_before, scratch, out=ndvi_after)
+    np.clip(ndvi_after, 0, 1, out=ndvi_after)
+
+# Default /api/ml/ndvi grid, and the largest grid a client may ask for (in cells)
+NDVI_DEFAULT_SHAPE = (64, 64)
+NDVI_MAX_CELLS = 1024 * 1024
+
+def _parse_ndvi_shape(value):
+    """Normalise a client 'shape' to a tuple of 1-3 positive ints, or None if it is malformed or too large"""
+    try:
+        shape = np.atleast_1d(value).astype(int)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if shape.ndim != 1 or not 1 <= shape.size <= 3 or (shape <= 0).any():
+        return None
+    if math.prod(shape.tolist()) > NDVI_MAX_CELLS:
+        return None
+    return tuple(shape.tolist())
+
+# Per-thread NDVI work buffers for the default shape, reused across fresh /api/ml/ndvi requests
+_ndvi_tls = threading.local()
+
+def _get_ndvi_buffers(shape: tuple):
+    """(before, after, scratch) float32 buffers: this thread's reused set for NDVI_DEFAULT_SHAPE,
+    fresh arrays for any other shape so client-chosen shapes aren't kept alive per thread"""
+    if shape != NDVI_DEFAULT_SHAPE:
+        return tuple(np.empty(shape, dtype=np.float32) for _ in range(3))
+    bufs = getattr(_ndvi_tls, 'bufs', None)
+    if bufs is None:
+        bufs = _ndvi_tls.bufs = tuple(np.empty(shape, dtype=np.float32) for _ in range(3))
+    return bufs
+
+# Pre-generated (before, after) NDVI pairs that requests round-robin through;
+# read-only since every request thread shares them
+NDVI_POOL_SIZE = 64
+
+def _build_ndvi_pool():
+    """Generate NDVI_POOL_SIZE synthetic (before, after) pairs of NDVI_DEFAULT_SHAPE"""
+    pool = []
+    scratch = np.empty(NDVI_DEFAULT_SHAPE, dtype=np.float32)
+    for _ in range(NDVI_POOL_SIZE):
+        ndvi_before = np.empty(NDVI_DEFAULT_SHAPE, dtype=np.float32)
+        ndvi_after = np.empty(NDVI_DEFAULT_SHAPE, dtype=np.float32)
+        _synthesize_ndvi(_rng(), ndvi_before, ndvi_after, scratch)
+        ndvi_before.setflags(write=False)
+        ndvi_after.setflags(write=False)
+        pool.append((ndvi_before, ndvi_after))
+    return pool
+
+_NDVI_POOL = _build_ndvi_pool()
+_ndvi_pool_counter = itertools.count()
+NDVIAnalyzer.calculate_ndvi_delta(*_NDVI_POOL[0])  # compile the kernel for the read-only pool arrays
+
 @app.route('/api/ml/ndvi', methods=['POST'])
 def analyze_ndvi():
     """Analyze NDVI data and detect burned areas"""
     try:
-        data = request.get_json()
+        data = request_json(request)
 
-        # Simulate NDVI data (in production, this would come from satellite imagery)
-        before_shape = data.get('shape', [64, 64])
-        ndvi_before = np.random.beta(3, 2, before_shape)  # Healthy vegetation
-        ndvi_after = ndvi_before - np.random.exponential(0.1, before_shape)  # After potential fire
-        ndvi_after = np.clip(ndvi_after, 0, 1)
+        # Simulate NDVI data (in production, this would come from satellite imagery);
+        # served from the pool unless the client asks for fresh data or another shape
+        before_shape = _parse_ndvi_shape(data.get('shape', NDVI_DEFAULT_SHAPE))
+        if before_shape is None:
+            return jsonify({
+                'success': False,
+                'error': f"'shape' must be 1 to 3 positive integers covering at most {NDVI_MAX_CELLS} cells"
+            }), 400
+        if before_shape == NDVI_DEFAULT_SHAPE and not data.get('fresh', False):
+            ndvi_before, ndvi_after = _NDVI_POOL[next(_ndvi_pool_counter) % NDVI_POOL_SIZE]
+        else:
+            ndvi_before, ndvi_after, scratch = _get_ndvi_buffers(before_shape)
+            _synthesize_ndvi(_rng(), ndvi_before, ndvi_after, scratch)
 
         # Analyze NDVI delta
         analysis = NDVIAnalyzer.calculate_ndvi_delta(ndvi_before, ndvi_after)
@@ -300,7 +782,7 @@ def analyze_ndvi():
                 'severity_level': 'high' if analysis['burn_severity'] > 0.5 else 'moderate' if analysis['burn_severity'] > 0.2 else 'low',
                 'recovery_potential': 'good' if analysis['recovery_index'] > 0.4 else 'moderate' if analysis['recovery_index'] > 0.2 else 'poor'
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts_cache.now()
         })
 
     except Exception as e:
@@ -309,56 +791,59 @@ def analyze_ndvi():
             'error': str(e)
         }), 500
 
+# Static model description, encoded once at import
+MODEL_INFO_JSON = dumps_bytes({
+    'success': True,
+    'models': {
+        'convlstm_unet': {
+            'name': 'ConvLSTM + UNet Hybrid Model',
+            'purpose': 'Spatiotemporal fire risk prediction',
+            'input_features': ['temperature', 'humidity', 'wind_speed', 'wind_direction', 'ndvi', 'elevation', 'slope', 'vegetation_density'],
+            'output': 'Fire risk probability (0-1)',
+            'accuracy': '97.2%'
+        },
+        'cellular_automata': {
+            'name': 'CA-based Fire Spread Model',
+            'purpose': 'Fire spread simulation',
+            'parameters': ['wind', 'temperature', 'humidity', 'fuel_load', 'terrain'],
+            'output': 'Spatial fire progression over time'
+        },
+        'ndvi_analyzer': {
+            'name': 'NDVI Delta Analysis',
+            'purpose': 'Burned area estimation',
+            'input': 'Pre/post fire NDVI imagery',
+            'output': 'Burn severity and recovery index'
+        },
+        'environmental_impact_estimator': {
+            'name': 'Environmental Impact Estimator',
+            'purpose': 'Estimates CO2 emissions and ecological loss from fire',
+            'input': ['simulation_results', 'environmental_data'],
+            'output': {
+                'estimated_co2_emissions_tonnes': 'float',
+                'long_term_ecological_loss': {
+                    'flora_impact': 'string',
+                    'fauna_impact': 'string',
+                    'biodiversity_impact': 'string'
+                }
+            }
+        }
+    },
+    'data_sources': [
+        'MODIS Satellite Imagery',
+        'Sentinel-2 Multispectral Data',
+        'ERA5 Weather Reanalysis',
+        'SRTM Digital Elevation Model',
+        'GHSL Human Settlement Data',
+        'Ground Weather Stations'
+    ],
+    'update_frequency': 'Real-time (30-second intervals)',
+    'coverage_area': 'Uttarakhand State, India (53,483 km²)'
+})
+
 @app.route('/api/ml/model-info', methods=['GET'])
 def get_model_info():
     """Get information about the ML models"""
-    return jsonify({
-        'success': True,
-        'models': {
-            'convlstm_unet': {
-                'name': 'ConvLSTM + UNet Hybrid Model',
-                'purpose': 'Spatiotemporal fire risk prediction',
-                'input_features': ['temperature', 'humidity', 'wind_speed', 'wind_direction', 'ndvi', 'elevation', 'slope', 'vegetation_density'],
-                'output': 'Fire risk probability (0-1)',
-                'accuracy': '97.2%'
-            },
-            'cellular_automata': {
-                'name': 'CA-based Fire Spread Model',
-                'purpose': 'Fire spread simulation',
-                'parameters': ['wind', 'temperature', 'humidity', 'fuel_load', 'terrain'],
-                'output': 'Spatial fire progression over time'
-            },
-            'ndvi_analyzer': {
-                'name': 'NDVI Delta Analysis',
-                'purpose': 'Burned area estimation',
-                'input': 'Pre/post fire NDVI imagery',
-                'output': 'Burn severity and recovery index'
-            },
-            'environmental_impact_estimator': {
-                'name': 'Environmental Impact Estimator',
-                'purpose': 'Estimates CO2 emissions and ecological loss from fire',
-                'input': ['simulation_results', 'environmental_data'],
-                'output': {
-                    'estimated_co2_emissions_tonnes': 'float',
-                    'long_term_ecological_loss': {
-                        'flora_impact': 'string',
-                        'fauna_impact': 'string',
-                        'biodiversity_impact': 'string'
-                    }
-                }
-            }
-        },
-        'data_sources': [
-            'MODIS Satellite Imagery',
-            'Sentinel-2 Multispectral Data',
-            'ERA5 Weather Reanalysis',
-            'SRTM Digital Elevation Model',
-            'GHSL Human Settlement Data',
-            'Ground Weather Stations'
-        ],
-        'update_frequency': 'Real-time (30-second intervals)',
-        'coverage_area': 'Uttarakhand State, India (53,483 km²)'
-    })
+    return Response(MODEL_INFO_JSON, mimetype='application/json')
 
 @app.route('/api/ml/health', methods=['GET'])
 def health_check():
@@ -368,7 +853,8 @@ def health_check():
         'status': 'healthy',
         'realtime_active': real_time_predictor.is_running,
         'models_loaded': True,
-        'timestamp': datetime.now().isoformat()
+        'prediction_cache': _cached_predict.cache_info()._asdict(),
+        'timestamp': ts_cache.now()
     })
 
 @app.route('/api/ml/start-realtime', methods=['POST'])
@@ -398,7 +884,7 @@ def optimize_resources():
         }), 503
 
     try:
-        data = request.get_json()
+        data = request_json(request)
 
         # Extract prediction data and resource needs
         fire_prediction_data = data.get('fire_prediction_data', {})
@@ -415,7 +901,7 @@ def optimize_resources():
         return jsonify({
             'success': True,
             'recommendations': recommendations,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts_cache.now()
         })
 
     except Exception as e:
@@ -444,7 +930,7 @@ def test_alert_system():
         }), 503
 
     try:
-        data = request.get_json()
+        data = request_json(request)
         region = data.get('region', 'Test Region')
         risk_score = data.get('risk_score', 0.8)
 
@@ -464,7 +950,7 @@ def test_alert_system():
 def get_evacuation_routes():
     """Generate safe evacuation routes from fire location"""
     try:
-        data = request.get_json()
+        data = request_json(request)
         fire_lat = data.get('fire_lat', 30.0)
         fire_lng = data.get('fire_lng', 79.0)
         risk_radius = data.get('risk_radius', 5)  # km
@@ -480,7 +966,7 @@ def get_evacuation_routes():
             'success': True,
             'fire_location': [fire_lat, fire_lng],
             'evacuation_routes': routes,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': ts_cache.now()
         })
 
     except Exception as e:
@@ -495,13 +981,7 @@ def get_safe_zones():
     try:
         from evacuation_routes import evacuation_system
 
-        safe_zones = evacuation_system.get_safe_zones()
-
-        return jsonify({
-            'success': True,
-            'safe_zones': safe_zones,
-            'count': len(safe_zones)
-        })
+        return Response(evacuation_system.get_safe_zones_json(), mimetype='application/json')
 
     except Exception as e:
         return jsonify({
@@ -513,4 +993,7 @@ if __name__ == '__main__':
     # Start real-time predictions automatically
     real_time_predictor.start_continuous_prediction()
 
-    app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
+    # Threaded development server; set ML_API_DEBUG=1 for the debugger.
+    # For production use gunicorn with a single process, since predictions live in memory:
+    # gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5001 ml_api:app
+    app.run(host='0.0.0.0', port=5001, threaded=True, debug=os.getenv('ML_API_DEBUG') == '1')
\ No newline at end of file
@@ -11,6 +11,12 @@ import requests
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 @dataclass
 class EnvironmentalData:
     """Data structure for environmental parameters"""
@@ -345,17 +351,65 @@ class CellularAutomataFireSpread:
             'spread_rate': burned_area  # Simplified spread rate
         }
 
+# Threshold for significant NDVI decrease (indicating possible burn)
+NDVI_BURN_THRESHOLD = 0.2
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _ndvi_kernel(before: np.ndarray, after: np.ndarray, burn_threshold):
+        """NDVI delta statistics over flat before/after arrays without temporaries
+        
+        Pixels are read in the input precision (float32 or float64); sums accumulate in float64.
+        Returns (delta mean, delta std, burned pixel count, BAI sum, post-fire NDVI sum over burned pixels)
+        """
+        n = before.size
+        delta_sum = 0.0
+        for i in range(n):
+            delta_sum += before[i] - after[i]
+        delta_mean = delta_sum / n
+        
+        sq_sum = 0.0
+        burn_count = 0
+        severity_sum = 0.0
+        recovery_sum = 0.0
+        for i in range(n):
+            delta = before[i] - after[i]
+            sq_sum += (delta - delta_mean) ** 2
+            if delta > burn_threshold:
+                # Burned Area Index (BAI)
+                burn_count += 1
+                severity_sum += 1.0 / ((0.1 - after[i]) ** 2 + (0.06 - after[i]) ** 2)
+                recovery_sum += after[i]
+        
+        return delta_mean, np.sqrt(sq_sum / n), burn_count, severity_sum, recovery_sum
+    
+    # Compile at import so the first /api/ml/ndvi request doesn't pay for it
+    for _dtype in (np.float64, np.float32):
+        _ndvi_kernel(np.ones(4, _dtype), np.zeros(4, _dtype), _dtype(NDVI_BURN_THRESHOLD))
+
 class NDVIAnalyzer:
     """NDVI Delta calculation and burned area estimation"""
     
     @staticmethod
     def calculate_ndvi_delta(ndvi_before: np.ndarray, ndvi_after: np.ndarray) -> Dict:
         """Calculate NDVI delta and estimate burned areas"""
+        if NUMBA_AVAILABLE and np.size(ndvi_before) > 0:
+            # float32 imagery stays float32; anything else runs in float64
+            dtype = np.float32 if np.result_type(ndvi_before, ndvi_after) == np.float32 else np.float64
+            before = np.ascontiguousarray(ndvi_before, dtype=dtype).ravel()
+            after = np.ascontiguousarray(np.broadcast_to(ndvi_after, np.shape(ndvi_before)), dtype=dtype).ravel()
+            delta_mean, delta_std, burn_count, severity_sum, recovery_sum = _ndvi_kernel(before, after, dtype(NDVI_BURN_THRESHOLD))
+            return {
+                'ndvi_delta_mean': float(delta_mean),
+                'ndvi_delta_std': float(delta_std),
+                'potential_burn_area_percent': float(burn_count / before.size * 100),
+                'burn_severity': float(severity_sum / burn_count) if burn_count else 0.0,
+                'recovery_index': float(recovery_sum / burn_count) if burn_count else 1.0
+            }
+        
         delta = ndvi_before - ndvi_after
         
-        # Threshold for significant NDVI decrease (indicating possible burn)
-        burn_threshold = 0.2
-        potential_burns = delta > burn_threshold
+        potential_burns = delta > NDVI_BURN_THRESHOLD
         
         # Calculate Burned Area Index (BAI)
         bai = np.where(potential_burns, 
@@ -531,14 +585,28 @@ def get_model_predictions(environmental_data: Dict) -> Dict:
     """Main function to get comprehensive fire risk predictions"""
     return fire_predictor.predict_comprehensive_risk(environmental_data)
 
+def _latlng_to_grid(lat: float, lng: float) -> Tuple[int, int]:
+    """Convert lat/lng to grid coordinates (simplified), clamped to the grid bounds"""
+    # Rough conversion for Uttarakhand region; clamp before truncating so
+    # out-of-range (and NaN) inputs land on the grid edge
+    x = (lat - 29.0) * 50.0
+    y = (lng - 79.0) * 50.0
+    if not x >= 0.0:
+        x = 0.0
+    elif x > 99.0:
+        x = 99.0
+    if not y >= 0.0:
+        y = 0.0
+    elif y > 99.0:
+        y = 99.0
+    return int(x), int(y)
+
+if NUMBA_AVAILABLE:
+    latlng_to_grid = njit(cache=True)(_latlng_to_grid)
+    latlng_to_grid(30.0, 79.0)  # compile at import
+else:
+    latlng_to_grid = _latlng_to_grid
+
 def simulate_fire_scenario(lat: float, lng: float, env_data: Dict) -> Dict:
     """Simulate fire spread scenario at given coordinates"""
-    # Convert lat/lng to grid coordinates (simplified)
-    grid_x = int((lat - 29.0) * 50)  # Rough conversion for Uttarakhand region
-    grid_y = int((lng - 79.0) * 50)
-    
-    # Ensure coordinates are within grid bounds
-    grid_x = max(0, min(99, grid_x))
-    grid_y = max(0, min(99, grid_y))
-    
-    return fire_predictor.simulate_fire_spread((grid_x, grid_y), env_data)
+    return fire_predictor.simulate_fire_spread(latlng_to_grid(lat, lng), env_data)
@@ -3,9 +3,174 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from threading import Lock
+from bisect import bisect_right
+from operator import attrgetter
+import hashlib
 import json
 
-@dataclass
+# Spatial index for large resource pools (optional: pip install scipy)
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Fused scoring kernel (optional: pip install numba)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371
+
+# Distinct predictions payloads whose simulated regional data is kept
+REGION_CACHE_SIZE = 256
+
+# Resource types with at least this many units get a KD-tree; smaller pools are scanned directly
+KDTREE_MIN_RESOURCES = 64
+
+# Travel speed per resource type
+SPEED_KMH = {
+    'firefighter_crew': 60,  # road vehicle
+    'water_tank': 50,       # heavy vehicle
+    'drone': 80,            # direct flight
+    'helicopter': 150       # direct flight
+}
+DEFAULT_SPEED_KMH = 60
+
+# Resource coordinates, ratings and scores are float32: ample precision at these distances,
+# half the bytes of float64 through the scoring pass
+SCORE_DTYPE = np.float32
+
+# Slack on the KD-tree score bound for float32 rounding of distances (km) and scores
+BOUND_DISTANCE_SLACK_KM = 1e-3
+BOUND_SCORE_SLACK = 1e-5
+
+# Integer codes for the hot-path string fields; types and statuses not listed get the next free code
+TYPES = {'firefighter_crew': 0, 'water_tank': 1, 'drone': 2, 'helicopter': 3}
+STATUS = {'available': 0, 'deployed': 1, 'maintenance': 2}
+STATUS_AVAILABLE = STATUS['available']
+PRIORITY = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+PRIORITY_UNKNOWN = len(PRIORITY)
+PRIORITY_NAMES = list(PRIORITY)
+
+# Bins of the regional conditions that index the resource requirements table; values not
+# listed fall into bin 0, which the requirement rules treat the same way
+RISK_BINS = (0.4, 0.6, 0.8)
+TERRAIN = {'easy': 0, 'moderate': 1, 'difficult': 2}
+VEGETATION = {'sparse': 0, 'moderate': 1, 'dense': 2}
+ACCESSIBILITY = {'high': 0, 'medium': 1, 'low': 2}
+
+# Base resource requirements per risk bin (below 0.4, 0.4-0.6, 0.6-0.8, 0.8 and above), before
+# the terrain, accessibility and vegetation adjustments
+REQ_TEMPLATES = (
+    {
+        'firefighter_crew': {'quantity': 0, 'priority': 'medium'},
+        'water_tank': {'quantity': 0, 'priority': 'medium'},
+        'drone': {'quantity': 0, 'priority': 'low'},
+        'helicopter': {'quantity': 0, 'priority': 'low'}
+    },
+    {
+        'firefighter_crew': {'quantity': 1, 'priority': 'medium'},
+        'water_tank': {'quantity': 0, 'priority': 'medium'},
+        'drone': {'quantity': 1, 'priority': 'medium'},
+        'helicopter': {'quantity': 0, 'priority': 'low'}
+    },
+    {
+        'firefighter_crew': {'quantity': 2, 'priority': 'high'},
+        'water_tank': {'quantity': 1, 'priority': 'high'},
+        'drone': {'quantity': 1, 'priority': 'medium'},
+        'helicopter': {'quantity': 0, 'priority': 'low'}
+    },
+    {
+        'firefighter_crew': {'quantity': 3, 'priority': 'critical'},
+        'water_tank': {'quantity': 2, 'priority': 'critical'},
+        'drone': {'quantity': 2, 'priority': 'high'},
+        'helicopter': {'quantity': 1, 'priority': 'high'}
+    }
+)
+
+def _haversine_vec(lats: np.ndarray, lngs: np.ndarray, cos_lats: np.ndarray, target_lat: float, target_lng: float) -> np.ndarray:
+    """Haversine distances in km from arrays of coordinates (with precomputed cos(lat)) to one target,
+    in the precision of the coordinate arrays"""
+    target_lat = lats.dtype.type(target_lat)
+    target_lng = lats.dtype.type(target_lng)
+    target_lat_rad = np.radians(target_lat)
+    delta_lat = np.radians(target_lat - lats)
+    delta_lon = np.radians(target_lng - lngs)
+    
+    a = (np.sin(delta_lat / 2) ** 2 +
+         cos_lats * np.cos(target_lat_rad) * np.sin(delta_lon / 2) ** 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    return EARTH_RADIUS_KM * c
+
+def _top_k_desc(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores in descending order, ties in index order, without a full sort"""
+    if k >= scores.size:
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # kth largest score by partial selection, then keep ties at the boundary in index order
+    kth = -np.partition(-scores, k - 1)[k - 1]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - above.size]
+    chosen = np.concatenate((above, ties))
+    chosen.sort()
+    return chosen[np.argsort(-scores[chosen], kind='stable')]
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _score_kernel(lat, lng, cos_lat, eff, cost, resp, type_code, status_code,
+                      target_lat, target_lng, want_type, speed_kmh, w0, w1, w2, w3):
+        """(scores, distances, travel times) over the resource columns in one pass: haversine distance,
+        travel time and the weighted score per resource, score -inf for resources of other types or not available
+        
+        speed_kmh holds the travel speed per type code. Coordinates, ratings, weights and the
+        target are float32, and every step stays in float32.
+        """
+        zero = np.float32(0)
+        one = np.float32(1)
+        half = np.float32(0.5)
+        diameter = np.float32(2 * EARTH_RADIUS_KM)
+        
+        n = lat.size
+        scores = np.empty(n, dtype=np.float32)
+        distances = np.empty(n, dtype=np.float32)
+        travel_times = np.empty(n, dtype=np.int64)
+        cos_target = np.cos(np.radians(target_lat))
+        for i in range(n):
+            if type_code[i] != want_type or status_code[i] != STATUS_AVAILABLE:
+                scores[i] = -np.inf
+                continue
+            
+            delta_lat = np.radians(target_lat - lat[i])
+            delta_lon = np.radians(target_lng - lng[i])
+            a = np.sin(delta_lat * half) ** 2 + cos_lat[i] * cos_target * np.sin(delta_lon * half) ** 2
+            distance = diameter * np.arctan2(np.sqrt(a), np.sqrt(one - a))
+            travel_time = int(distance / speed_kmh[type_code[i]] * np.float32(60)) + resp[i]
+            distances[i] = distance
+            travel_times[i] = travel_time
+            
+            scores[i] = (
+                max(zero, one - (distance / np.float32(100))) * w0 +
+                eff[i] * w1 +
+                max(zero, one - (cost[i] / np.float32(20000))) * w2 +
+                max(zero, one - (np.float32(travel_time) / np.float32(180))) * w3
+            )
+        return scores, distances, travel_times
+    
+    # Compile at import so the first deployment request doesn't pay for it
+    _f32 = np.float32
+    _score_kernel(np.zeros(1, _f32), np.zeros(1, _f32), np.ones(1, _f32), np.zeros(1, _f32), np.zeros(1, _f32),
+                  np.zeros(1, np.int64), np.zeros(1, np.int8), np.zeros(1, np.int8), _f32(0), _f32(0), 0,
+                  np.full(1, 60, _f32), _f32(0.25), _f32(0.25), _f32(0.25), _f32(0.25))
+
+@dataclass(slots=True)
 class Resource:
     """Represents a firefighting resource"""
     id: str
@@ -17,7 +182,7 @@ class Resource:
     operational_cost_per_hour: float
     effectiveness_rating: float  # 0-1 scale
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRecommendation:
     """Represents a resource deployment recommendation"""
     resource_id: str
@@ -31,11 +196,32 @@ class ResourceRecommendation:
     cost_estimate: float
     effectiveness_score: float
 
+# API field name -> ResourceRecommendation attribute, read with one attrgetter call per recommendation
+RECOMMENDATION_FIELDS = {
+    'resource_id': 'resource_id',
+    'resource_type': 'resource_type',
+    'priority': 'priority',
+    'region': 'region_name',
+    'deployment_location': 'deployment_location',
+    'arrival_time_minutes': 'estimated_arrival_time',
+    'duration_hours': 'recommended_duration',
+    'justification': 'justification',
+    'cost_estimate': 'cost_estimate',
+    'effectiveness_score': 'effectiveness_score'
+}
+_RECOMMENDATION_KEYS = tuple(RECOMMENDATION_FIELDS)
+_recommendation_values = attrgetter(*RECOMMENDATION_FIELDS.values())
+
 class ResourceOptimizationEngine:
     """AI-powered resource optimization engine for forest fire management"""
     
     def __init__(self):
+        self._rng = np.random.default_rng()
         self.available_resources = self._initialize_resources()
+        self._index_resources()
+        self._req_table = self._build_requirements_table()
+        self._region_cache = OrderedDict()  # predictions JSON -> regional data
+        self._region_cache_lock = Lock()  # request threads share the cache and self._rng
         self.deployment_history = []
         self.efficiency_weights = {
             'response_time': 0.25,
@@ -57,6 +243,8 @@ class ResourceOptimizationEngine:
             ("Rishikesh Fire Station", 30.0869, 78.2676)
         ]
         
+        response_jitter = self._rng.integers(0, 10, size=len(firefighter_locations)).tolist()
+        effectiveness_jitter = self._rng.random(len(firefighter_locations)).tolist()
         for i, (name, lat, lng) in enumerate(firefighter_locations):
             resources.append(Resource(
                 id=f"crew_{i+1}",
@@ -64,9 +252,9 @@ class ResourceOptimizationEngine:
                 location=(lat, lng),
                 capacity=15,  # crew size
                 status="available",
-                response_time_minutes=15 + np.random.randint(0, 10),
+                response_time_minutes=15 + response_jitter[i],
                 operational_cost_per_hour=2500,  # INR per hour
-                effectiveness_rating=0.85 + np.random.random() * 0.1
+                effectiveness_rating=0.85 + effectiveness_jitter[i] * 0.1
             ))
         
         # Water Tankers
@@ -76,6 +264,8 @@ class ResourceOptimizationEngine:
             (30.3000, 78.0500),  # Near Dehradun
         ]
         
+        response_jitter = self._rng.integers(0, 15, size=len(tanker_locations)).tolist()
+        effectiveness_jitter = self._rng.random(len(tanker_locations)).tolist()
         for i, (lat, lng) in enumerate(tanker_locations):
             resources.append(Resource(
                 id=f"tanker_{i+1}",
@@ -83,9 +273,9 @@ class ResourceOptimizationEngine:
                 location=(lat, lng),
                 capacity=5000,  # liters
                 status="available",
-                response_time_minutes=20 + np.random.randint(0, 15),
+                response_time_minutes=20 + response_jitter[i],
                 operational_cost_per_hour=1200,
-                effectiveness_rating=0.75 + np.random.random() * 0.15
+                effectiveness_rating=0.75 + effectiveness_jitter[i] * 0.15
             ))
         
         # Surveillance Drones
@@ -94,6 +284,8 @@ class ResourceOptimizationEngine:
             (30.3200, 78.0200),  # Dehradun base
         ]
         
+        response_jitter = self._rng.integers(0, 5, size=len(drone_bases)).tolist()
+        effectiveness_jitter = self._rng.random(len(drone_bases)).tolist()
         for i, (lat, lng) in enumerate(drone_bases):
             resources.append(Resource(
                 id=f"drone_{i+1}",
@@ -101,9 +293,9 @@ class ResourceOptimizationEngine:
                 location=(lat, lng),
                 capacity=4,  # flight hours
                 status="available",
-                response_time_minutes=5 + np.random.randint(0, 5),
+                response_time_minutes=5 + response_jitter[i],
                 operational_cost_per_hour=800,
-                effectiveness_rating=0.70 + np.random.random() * 0.20
+                effectiveness_rating=0.70 + effectiveness_jitter[i] * 0.20
             ))
         
         # Helicopters
@@ -112,6 +304,8 @@ class ResourceOptimizationEngine:
             (29.3900, 79.4600),  # Nainital helipad
         ]
         
+        response_jitter = self._rng.integers(0, 8, size=len(helicopter_bases)).tolist()
+        effectiveness_jitter = self._rng.random(len(helicopter_bases)).tolist()
         for i, (lat, lng) in enumerate(helicopter_bases):
             resources.append(Resource(
                 id=f"helicopter_{i+1}",
@@ -119,13 +313,73 @@ class ResourceOptimizationEngine:
                 location=(lat, lng),
                 capacity=2000,  # water capacity in liters
                 status="available",
-                response_time_minutes=10 + np.random.randint(0, 8),
+                response_time_minutes=10 + response_jitter[i],
                 operational_cost_per_hour=15000,
-                effectiveness_rating=0.90 + np.random.random() * 0.05
+                effectiveness_rating=0.90 + effectiveness_jitter[i] * 0.05
             ))
         
         return resources
     
+    def _index_resources(self):
+        """Build struct-of-arrays columns over available_resources for vectorized scoring"""
+        resources = self.available_resources
+        self._res_lat = np.array([r.location[0] for r in resources], dtype=SCORE_DTYPE)
+        self._res_lng = np.array([r.location[1] for r in resources], dtype=SCORE_DTYPE)
+        self._res_cos_lat = np.cos(np.radians(self._res_lat))  # invariant until a resource moves
+        self._res_index = {}
+        for i, r in enumerate(resources):
+            self._res_index.setdefault(r.id, i)
+        self._type_table = dict(TYPES)
+        self._status_table = dict(STATUS)
+        self._type_codes = np.array([self._intern(self._type_table, r.type) for r in resources], dtype=np.int8)
+        self._status_codes = np.array([self._intern(self._status_table, r.status) for r in resources], dtype=np.int8)
+        # Travel speed indexed by type code
+        self._speed_kmh = np.array([SPEED_KMH.get(name, DEFAULT_SPEED_KMH) for name in self._type_table],
+                                   dtype=SCORE_DTYPE)
+        self._res_capacity = np.array([r.capacity for r in resources])
+        self._res_effectiveness = np.array([r.effectiveness_rating for r in resources], dtype=SCORE_DTYPE)
+        self._res_cost = np.array([r.operational_cost_per_hour for r in resources], dtype=SCORE_DTYPE)
+        self._res_response = np.array([r.response_time_minutes for r in resources], dtype=np.int64)
+        self._build_type_trees()
+        self._dirty = False  # set when a move leaves the KD-trees stale
+    
+    def _rebuild_caches(self, trees: bool = True):
+        """Bring derived resource data (and the KD-trees, if trees) up to date; a no-op unless something changed"""
+        if len(self.available_resources) != self._res_lat.size:
+            # Resources were added or removed outside update_resource_status
+            self._index_resources()
+        elif trees and self._dirty:
+            self._dirty = False
+            self._build_type_trees()
+    
+    @staticmethod
+    def _intern(table: Dict[str, int], name: str) -> int:
+        """Integer code for a type or status name, assigning the next code to new names"""
+        code = table.get(name)
+        if code is None:
+            code = table[name] = len(table)
+        return code
+    
+    def _build_type_trees(self):
+        """Per-type KD-trees over unit-sphere positions (chord order = great-circle order),
+        with the type's best effectiveness, cost and response time for score bounds"""
+        self._type_trees = {}
+        if not SCIPY_AVAILABLE:
+            return
+        
+        lats_rad = np.radians(self._res_lat)
+        lngs_rad = np.radians(self._res_lng)
+        xyz = np.column_stack((self._res_cos_lat * np.cos(lngs_rad),
+                               self._res_cos_lat * np.sin(lngs_rad),
+                               np.sin(lats_rad)))
+        for type_code in np.unique(self._type_codes).tolist():
+            rows = np.flatnonzero(self._type_codes == type_code)
+            if rows.size >= KDTREE_MIN_RESOURCES:
+                bound = (float(self._res_effectiveness[rows].max()),
+                         float(self._res_cost[rows].min()),
+                         int(self._res_response[rows].min()))
+                self._type_trees[type_code] = (cKDTree(xyz[rows]), rows, bound)
+    
     def optimize_resource_deployment(self, predictions: Dict) -> List[ResourceRecommendation]:
         """Generate optimal resource deployment recommendations based on fire predictions"""
         recommendations = []
@@ -140,16 +394,47 @@ class ResourceOptimizationEngine:
             region_recommendations = self._optimize_for_region(region_data)
             recommendations.extend(region_recommendations)
         
-        # Sort recommendations by priority and effectiveness
-        recommendations.sort(key=lambda x: (
-            self._priority_score(x.priority),
-            -x.effectiveness_score
-        ))
+        # Sort recommendations by priority and effectiveness (stable, so ties keep region order)
+        priority = np.fromiter((PRIORITY.get(x.priority, PRIORITY_UNKNOWN) for x in recommendations),
+                               dtype=np.int8, count=len(recommendations))
+        effectiveness = np.fromiter((x.effectiveness_score for x in recommendations),
+                                    dtype=np.float64, count=len(recommendations))
+        order = np.lexsort((-effectiveness, priority))[:15]
         
-        return recommendations[:15]  # Return top 15 recommendations
+        return [recommendations[i] for i in order.tolist()]  # Return top 15 recommendations
     
     def _extract_regional_predictions(self, predictions: Dict) -> List[Dict]:
-        """Extract and structure regional prediction data"""
+        """Extract and structure regional prediction data
+        
+        The simulated regional conditions are seeded from the predictions, so the same
+        predictions always yield the same regions; results are memoized per predictions.
+        """
+        try:
+            key = json.dumps(predictions, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            key = None
+        
+        with self._region_cache_lock:
+            regions_data = self._region_cache.get(key) if key is not None else None
+            if regions_data is None:
+                if key is not None:
+                    seed = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+                    rng = np.random.default_rng(seed)
+                else:
+                    rng = self._rng
+                regions_data = self._simulate_regional_predictions(rng)
+                if key is not None:
+                    self._region_cache[key] = regions_data
+                    if len(self._region_cache) > REGION_CACHE_SIZE:
+                        self._region_cache.popitem(last=False)
+            else:
+                self._region_cache.move_to_end(key)
+        
+        # Callers get their own dicts, so the cached entries stay untouched
+        return [dict(region_data) for region_data in regions_data]
+    
+    def _simulate_regional_predictions(self, rng: np.random.Generator) -> List[Dict]:
+        """Simulate regional prediction data from the given generator"""
         regions_data = []
         
         # Regional coordinates mapping
@@ -170,10 +455,18 @@ class ResourceOptimizationEngine:
             'Rishikesh': 0.35
         }
         
-        for region, coords in region_coords.items():
+        # One draw per attribute for all regions
+        n_regions = len(region_coords)
+        variation = rng.random(n_regions).tolist()
+        terrain = rng.choice(['easy', 'moderate', 'difficult'], size=n_regions).tolist()
+        vegetation = rng.choice(['sparse', 'moderate', 'dense'], size=n_regions).tolist()
+        wind_speed = (10 + rng.integers(0, 15, size=n_regions)).tolist()
+        accessibility = rng.choice(['high', 'medium', 'low'], size=n_regions).tolist()
+        
+        for i, (region, coords) in enumerate(region_coords.items()):
             risk_score = base_risks.get(region, 0.5)
             # Add some variation
-            risk_score += (np.random.random() - 0.5) * 0.1
+            risk_score += (variation[i] - 0.5) * 0.1
             risk_score = max(0, min(1, risk_score))
             
             regions_data.append({
@@ -181,10 +474,10 @@ class ResourceOptimizationEngine:
                 'coordinates': coords,
                 'risk_score': risk_score,
                 'risk_level': self._categorize_risk(risk_score),
-                'terrain_difficulty': np.random.choice(['easy', 'moderate', 'difficult']),
-                'vegetation_density': np.random.choice(['sparse', 'moderate', 'dense']),
-                'wind_speed': 10 + np.random.randint(0, 15),
-                'accessibility': np.random.choice(['high', 'medium', 'low'])
+                'terrain_difficulty': terrain[i],
+                'vegetation_density': vegetation[i],
+                'wind_speed': wind_speed[i],
+                'accessibility': accessibility[i]
             })
         
         return regions_data
@@ -220,51 +513,45 @@ class ResourceOptimizationEngine:
                     resource_type, coords, requirement
                 )
                 
-                for resource in suitable_resources[:requirement['quantity']]:
+                for resource, distance, travel_time, _ in suitable_resources[:requirement['quantity']]:
                     recommendation = self._create_recommendation(
-                        resource, region_data, requirement
+                        resource, region_data, requirement, distance, travel_time
                     )
                     recommendations.append(recommendation)
         
         return recommendations
     
+    def _build_requirements_table(self) -> np.ndarray:
+        """(quantity, priority code) per resource type for every (risk, terrain, vegetation, accessibility) bin"""
+        risk_values = (0.0,) + RISK_BINS
+        table = np.zeros((len(risk_values), len(TERRAIN), len(VEGETATION), len(ACCESSIBILITY), len(TYPES), 2),
+                         dtype=np.int8)
+        for r, risk_score in enumerate(risk_values):
+            for terrain, t in TERRAIN.items():
+                for vegetation, v in VEGETATION.items():
+                    for accessibility, a in ACCESSIBILITY.items():
+                        requirements = self._requirements_by_rules(risk_score, terrain, vegetation, accessibility)
+                        for resource_type, code in TYPES.items():
+                            table[r, t, v, a, code] = (requirements[resource_type]['quantity'],
+                                                       PRIORITY[requirements[resource_type]['priority']])
+        return table
+    
     def _calculate_resource_requirements(self, region_data: Dict) -> Dict:
         """Calculate resource requirements based on regional conditions"""
-        risk_score = region_data['risk_score']
-        terrain = region_data['terrain_difficulty']
-        vegetation = region_data['vegetation_density']
-        accessibility = region_data['accessibility']
-        
-        # Base requirements
-        requirements = {
-            'firefighter_crew': {'quantity': 0, 'priority': 'medium'},
-            'water_tank': {'quantity': 0, 'priority': 'medium'},
-            'drone': {'quantity': 0, 'priority': 'low'},
-            'helicopter': {'quantity': 0, 'priority': 'low'}
+        rows = self._req_table[bisect_right(RISK_BINS, region_data['risk_score']),
+                               TERRAIN.get(region_data['terrain_difficulty'], 0),
+                               VEGETATION.get(region_data['vegetation_density'], 0),
+                               ACCESSIBILITY.get(region_data['accessibility'], 0)].tolist()
+        return {
+            resource_type: {'quantity': quantity, 'priority': PRIORITY_NAMES[priority]}
+            for resource_type, (quantity, priority) in zip(TYPES, rows)
         }
-        
-        # Adjust based on risk score
-        if risk_score >= 0.8:
-            requirements['firefighter_crew']['quantity'] = 3
-            requirements['firefighter_crew']['priority'] = 'critical'
-            requirements['water_tank']['quantity'] = 2
-            requirements['water_tank']['priority'] = 'critical'
-            requirements['helicopter']['quantity'] = 1
-            requirements['helicopter']['priority'] = 'high'
-            requirements['drone']['quantity'] = 2
-            requirements['drone']['priority'] = 'high'
-        elif risk_score >= 0.6:
-            requirements['firefighter_crew']['quantity'] = 2
-            requirements['firefighter_crew']['priority'] = 'high'
-            requirements['water_tank']['quantity'] = 1
-            requirements['water_tank']['priority'] = 'high'
-            requirements['drone']['quantity'] = 1
-            requirements['drone']['priority'] = 'medium'
-        elif risk_score >= 0.4:
-            requirements['firefighter_crew']['quantity'] = 1
-            requirements['firefighter_crew']['priority'] = 'medium'
-            requirements['drone']['quantity'] = 1
-            requirements['drone']['priority'] = 'medium'
+    
+    def _requirements_by_rules(self, risk_score: float, terrain: str, vegetation: str, accessibility: str) -> Dict:
+        """Resource requirements for one set of regional conditions, used to fill the requirements table"""
+        # Base requirements for the risk bin; only the terrain and vegetation adjustments are applied here
+        template = REQ_TEMPLATES[bisect_right(RISK_BINS, risk_score)]
+        requirements = {resource_type: dict(requirement) for resource_type, requirement in template.items()}
         
         # Adjust for terrain and accessibility
         if terrain == 'difficult' or accessibility == 'low':
@@ -278,87 +565,122 @@ class ResourceOptimizationEngine:
         
         return requirements
     
-    def _find_suitable_resources(self, resource_type: str, target_coords: Tuple[float, float], requirement: Dict) -> List[Resource]:
-        """Find suitable resources for deployment"""
-        suitable_resources = []
-        
-        for resource in self.available_resources:
-            if (resource.type == resource_type and 
-                resource.status == 'available'):
-                
-                # Calculate distance and travel time
-                distance = self._calculate_distance(resource.location, target_coords)
-                travel_time = self._estimate_travel_time(resource, distance)
-                
-                # Calculate suitability score
-                suitability_score = self._calculate_suitability_score(
-                    resource, distance, travel_time, requirement
-                )
-                
-                suitable_resources.append((resource, suitability_score, travel_time))
-        
-        # Sort by suitability score (descending)
-        suitable_resources.sort(key=lambda x: x[1], reverse=True)
-        
-        return [resource for resource, score, time in suitable_resources]
+    def _find_suitable_resources(self, resource_type: str, target_coords: Tuple[float, float],
+                                 requirement: Dict) -> List[Tuple[Resource, float, int, float]]:
+        """Find suitable resources for deployment as (resource, distance km, travel minutes, suitability score)"""
+        quantity = requirement['quantity']
+        if quantity <= 0:
+            return []
+        
+        self._rebuild_caches()
+        type_code = self._type_table.get(resource_type)
+        if type_code is None:
+            return []
+        
+        if type_code in self._type_trees:
+            # Large pools: score only as many of the nearest resources as can reach the top quantity
+            candidates, suitability_score, distance, travel_time = \
+                self._tree_candidates(resource_type, target_coords, quantity)
+        elif NUMBA_AVAILABLE:
+            scores, distances, travel_times = _score_kernel(self._res_lat, self._res_lng, self._res_cos_lat,
+                                   self._res_effectiveness, self._res_cost, self._res_response,
+                                   self._type_codes, self._status_codes,
+                                   SCORE_DTYPE(target_coords[0]), SCORE_DTYPE(target_coords[1]), type_code,
+                                   self._speed_kmh, *self._weight_vector())
+            candidates = np.flatnonzero(scores > -np.inf)
+            suitability_score = scores[candidates]
+            distance = distances[candidates]
+            travel_time = travel_times[candidates]
+        else:
+            candidates = np.flatnonzero((self._type_codes == type_code) & (self._status_codes == STATUS_AVAILABLE))
+            suitability_score, distance, travel_time = self._score_candidates(candidates, target_coords)
+        if candidates.size == 0:
+            return []
+        
+        # Best requirement['quantity'] resources by suitability score (descending), ties in resource order
+        order = _top_k_desc(suitability_score, quantity)
+        resources = self.available_resources
+        return [
+            (resources[i], d, t, score)
+            for i, d, t, score in zip(candidates[order].tolist(), distance[order].tolist(),
+                                      travel_time[order].tolist(), suitability_score[order].tolist())
+        ]
     
-    def _calculate_distance(self, coord1: Tuple[float, float], coord2: Tuple[float, float]) -> float:
-        """Calculate distance between two coordinates in kilometers"""
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
-        
-        # Haversine formula
-        R = 6371  # Earth's radius in kilometers
-        
-        lat1_rad = np.radians(lat1)
-        lat2_rad = np.radians(lat2)
-        delta_lat = np.radians(lat2 - lat1)
-        delta_lon = np.radians(lon2 - lon1)
-        
-        a = (np.sin(delta_lat / 2) ** 2 + 
-             np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2)
-        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
-        
-        return R * c
+    def _score_candidates(self, candidates: np.ndarray, target_coords: Tuple[float, float]):
+        """(scores, distances, travel times) of the given resource rows
+        
+        Each score weights four factors, each at most 1: closeness (1 - km / 100), effectiveness rating,
+        cost (1 - cost per hour / 20000) and response (1 - travel minutes / 180), negatives clipped to 0.
+        Travel minutes are whole minutes at the type's speed plus the resource's response time.
+        """
+        # Distance and travel time for every candidate at once
+        distance = _haversine_vec(self._res_lat[candidates], self._res_lng[candidates],
+                                  self._res_cos_lat[candidates], *target_coords)
+        travel_time = (distance / self._speed_kmh[self._type_codes[candidates]] * 60).astype(np.int64) + \
+                      self._res_response[candidates]
+        
+        # One row per score factor, weighted and summed by a single dot product
+        features = np.empty((4, candidates.size), dtype=SCORE_DTYPE)
+        distance_score, effectiveness_score, cost_score, time_score = features
+        np.subtract(1, distance / 100, out=distance_score)
+        np.take(self._res_effectiveness, candidates, out=effectiveness_score)
+        np.subtract(1, self._res_cost[candidates] / 20000, out=cost_score)
+        np.subtract(1, travel_time / 180, out=time_score)
+        for factor in (distance_score, cost_score, time_score):
+            np.maximum(factor, 0, out=factor)
+        
+        scores = self._weight_vector() @ features
+        return scores, distance, travel_time
     
-    def _estimate_travel_time(self, resource: Resource, distance: float) -> int:
-        """Estimate travel time in minutes"""
-        speed_kmh = {
-            'firefighter_crew': 60,  # road vehicle
-            'water_tank': 50,       # heavy vehicle
-            'drone': 80,            # direct flight
-            'helicopter': 150       # direct flight
-        }
-        
-        base_speed = speed_kmh.get(resource.type, 60)
-        travel_time_hours = distance / base_speed
-        travel_time_minutes = int(travel_time_hours * 60) + resource.response_time_minutes
-        
-        return travel_time_minutes
+    def _weight_vector(self) -> np.ndarray:
+        """efficiency_weights in score-factor order (distance, effectiveness, cost, time)"""
+        weights = self.efficiency_weights
+        return np.array([weights['response_time'], weights['effectiveness'],
+                         weights['cost_efficiency'], weights['resource_availability']], dtype=SCORE_DTYPE)
     
-    def _calculate_suitability_score(self, resource: Resource, distance: float, travel_time: int, requirement: Dict) -> float:
-        """Calculate resource suitability score"""
-        # Factors affecting suitability
-        distance_score = max(0, 1 - (distance / 100))  # Prefer closer resources
-        time_score = max(0, 1 - (travel_time / 180))    # Prefer faster response
-        effectiveness_score = resource.effectiveness_rating
-        cost_score = max(0, 1 - (resource.operational_cost_per_hour / 20000))  # Prefer cost-effective
-        
-        # Weighted combination
-        suitability_score = (
-            distance_score * self.efficiency_weights['response_time'] +
-            effectiveness_score * self.efficiency_weights['effectiveness'] +
-            cost_score * self.efficiency_weights['cost_efficiency'] +
-            time_score * self.efficiency_weights['resource_availability']
-        )
-        
-        return suitability_score
+    def _tree_candidates(self, resource_type: str, target_coords: Tuple[float, float], quantity: int):
+        """(rows, scores, distances, travel times) of available resources of a type, nearest first,
+        growing the search until no resource outside it can score into the top quantity"""
+        tree, rows, bound = self._type_trees[self._type_table[resource_type]]
+        eff_max, cost_min, response_min = bound
+        weights = self.efficiency_weights
+        speed = float(self._speed_kmh[self._type_table[resource_type]])
+        
+        lat_rad, lng_rad = np.radians(target_coords[0]), np.radians(target_coords[1])
+        target = (np.cos(lat_rad) * np.cos(lng_rad), np.cos(lat_rad) * np.sin(lng_rad), np.sin(lat_rad))
+        
+        n_query = min(rows.size, max(3 * quantity, 1))
+        while True:
+            _, nearest = tree.query(target, k=n_query)
+            nearest = np.sort(rows[np.atleast_1d(nearest)])
+            candidates = nearest[self._status_codes[nearest] == STATUS_AVAILABLE]
+            scores, distance, travel_time = self._score_candidates(candidates, target_coords)
+            if n_query == rows.size:
+                return candidates, scores, distance, travel_time
+            
+            if candidates.size >= quantity:
+                # Every resource outside the search is at least as far as the farthest one queried;
+                # bound its score with the type's best effectiveness, cost and response time
+                max_distance = float(_haversine_vec(self._res_lat[nearest], self._res_lng[nearest],
+                                                    self._res_cos_lat[nearest], *target_coords).max())
+                max_distance = max(0.0, max_distance - BOUND_DISTANCE_SLACK_KM)
+                travel_min = int(max_distance / speed * 60) + response_min
+                score_bound = (
+                    max(0, 1 - (max_distance / 100)) * weights['response_time'] +
+                    eff_max * weights['effectiveness'] +
+                    max(0, 1 - (cost_min / 20000)) * weights['cost_efficiency'] +
+                    max(0, 1 - (travel_min / 180)) * weights['resource_availability']
+                )
+                kth_score = -np.partition(-scores, quantity - 1)[quantity - 1]
+                if kth_score > score_bound + BOUND_SCORE_SLACK:
+                    return candidates, scores, distance, travel_time
+            
+            n_query = min(rows.size, n_query * 4)
     
-    def _create_recommendation(self, resource: Resource, region_data: Dict, requirement: Dict) -> ResourceRecommendation:
-        """Create a resource deployment recommendation"""
+    def _create_recommendation(self, resource: Resource, region_data: Dict, requirement: Dict,
+                               distance: float, travel_time: int) -> ResourceRecommendation:
+        """Create a resource deployment recommendation from the distance and travel time found while scoring"""
         coords = region_data['coordinates']
-        distance = self._calculate_distance(resource.location, coords)
-        travel_time = self._estimate_travel_time(resource, distance)
         
         # Estimate deployment duration based on risk level
         duration_hours = {
@@ -371,7 +693,7 @@ class ResourceOptimizationEngine:
         cost_estimate = resource.operational_cost_per_hour * duration_hours
         
         # Generate justification
-        justification = self._generate_justification(resource, region_data, distance)
+        justification = self._generate_justification(resource, region_data, travel_time)
         
         # Calculate effectiveness score
         effectiveness_score = (
@@ -393,7 +715,7 @@ class ResourceOptimizationEngine:
             effectiveness_score=effectiveness_score
         )
     
-    def _generate_justification(self, resource: Resource, region_data: Dict, distance: float) -> str:
+    def _generate_justification(self, resource: Resource, region_data: Dict, travel_time: int) -> str:
         """Generate human-readable justification for resource deployment"""
         region = region_data['region']
         risk_level = region_data['risk_level']
@@ -409,17 +731,12 @@ class ResourceOptimizationEngine:
         resource_name = resource_names.get(resource.type, resource.type)
         
         if risk_level == 'very-high':
-            return f"Critical deployment needed for {region} due to very high fire risk ({risk_score:.1%}). {resource_name} can reach in {self._estimate_travel_time(resource, distance)} minutes."
+            return f"Critical deployment needed for {region} due to very high fire risk ({risk_score:.1%}). {resource_name} can reach in {travel_time} minutes."
         elif risk_level == 'high':
             return f"High priority deployment to {region} for fire risk mitigation ({risk_score:.1%}). {resource_name} provides effective coverage."
         else:
             return f"Preventive deployment to {region} for fire risk monitoring and rapid response capability."
     
-    def _priority_score(self, priority: str) -> int:
-        """Convert priority to numeric score for sorting"""
-        scores = {'critical': 1, 'high': 2, 'medium': 3, 'low': 4}
-        return scores.get(priority, 5)
-    
     def _elevate_priority(self, current_priority: str) -> str:
         """Elevate priority by one level"""
         elevation_map = {
@@ -442,43 +759,75 @@ class ResourceOptimizationEngine:
             'average_response_time': {}
         }
         
-        for resource in self.available_resources:
-            # Status counts
-            summary[resource.status] += 1
+        self._rebuild_caches()
+        type_names = list(self._type_table)
+        status_names = list(self._status_table)
+        n_types, n_statuses = len(type_names), len(status_names)
+        type_codes = self._type_codes.astype(np.intp)
+        
+        # Resource counts per (type, status) in one pass
+        counts = np.bincount(type_codes * n_statuses + self._status_codes,
+                             minlength=n_types * n_statuses).reshape(n_types, n_statuses)
+        for status, count in enumerate(counts.sum(axis=0).tolist()):
+            if count:
+                summary[status_names[status]] += count
+        
+        # Capacity and response-time totals of the available resources per type
+        available = self._status_codes == STATUS_AVAILABLE
+        types_available = type_codes[available]
+        available_count = np.bincount(types_available, minlength=n_types)
+        capacity_sum = np.bincount(types_available, weights=self._res_capacity[available], minlength=n_types)
+        response_sum = np.bincount(types_available, weights=self._res_response[available], minlength=n_types)
+        average_response = np.divide(response_sum, available_count,
+                                     out=np.zeros(n_types), where=available_count > 0)
+        if np.issubdtype(self._res_capacity.dtype, np.integer):
+            capacity_totals = capacity_sum.astype(np.int64).tolist()
+        else:
+            capacity_totals = capacity_sum.tolist()
+        
+        # Types in order of first appearance
+        present, first_row = np.unique(type_codes, return_index=True)
+        type_order = present[np.argsort(first_row)].tolist()
+        
+        counts = counts.tolist()
+        available_count = available_count.tolist()
+        average_response = average_response.tolist()
+        for type_code in type_order:
+            resource_type = type_names[type_code]
             
             # By type
-            if resource.type not in summary['by_type']:
-                summary['by_type'][resource.type] = {
-                    'total': 0, 'available': 0, 'deployed': 0, 'maintenance': 0
-                }
-            summary['by_type'][resource.type]['total'] += 1
-            summary['by_type'][resource.type][resource.status] += 1
-            
-            # Capacity tracking
-            if resource.type not in summary['total_capacity']:
-                summary['total_capacity'][resource.type] = 0
-                summary['average_response_time'][resource.type] = []
+            by_type = {'total': sum(counts[type_code]), 'available': 0, 'deployed': 0, 'maintenance': 0}
+            for status, count in enumerate(counts[type_code]):
+                if count:
+                    by_type[status_names[status]] += count
+            summary['by_type'][resource_type] = by_type
             
-            if resource.status == 'available':
-                summary['total_capacity'][resource.type] += resource.capacity
-                summary['average_response_time'][resource.type].append(resource.response_time_minutes)
-        
-        # Calculate average response times
-        for resource_type in summary['average_response_time']:
-            times = summary['average_response_time'][resource_type]
-            summary['average_response_time'][resource_type] = sum(times) / len(times) if times else 0
+            if available_count[type_code]:
+                summary['total_capacity'][resource_type] = capacity_totals[type_code]
+                summary['average_response_time'][resource_type] = average_response[type_code]
+            else:
+                summary['total_capacity'][resource_type] = 0
+                summary['average_response_time'][resource_type] = 0
         
         return summary
     
     def update_resource_status(self, resource_id: str, new_status: str, location: Optional[Tuple[float, float]] = None) -> bool:
         """Update resource status and location"""
-        for resource in self.available_resources:
-            if resource.id == resource_id:
-                resource.status = new_status
-                if location:
-                    resource.location = location
-                return True
-        return False
+        self._rebuild_caches(trees=False)
+        i = self._res_index.get(resource_id)
+        if i is None:
+            return False
+        
+        resource = self.available_resources[i]
+        resource.status = new_status
+        self._status_codes[i] = self._intern(self._status_table, new_status)
+        if location:
+            resource.location = location
+            self._res_lat[i], self._res_lng[i] = location
+            self._res_cos_lat[i] = np.cos(np.radians(self._res_lat[i]))
+            if int(self._type_codes[i]) in self._type_trees:
+                self._dirty = True  # trees are rebuilt on the next query
+        return True
 
 # Global resource optimizer instance
 resource_optimizer = ResourceOptimizationEngine()
@@ -489,18 +838,7 @@ def get_resource_recommendations(predictions: Dict) -> Dict:
     
     return {
         'recommendations': [
-            {
-                'resource_id': rec.resource_id,
-                'resource_type': rec.resource_type,
-                'priority': rec.priority,
-                'region': rec.region_name,
-                'deployment_location': rec.deployment_location,
-                'arrival_time_minutes': rec.estimated_arrival_time,
-                'duration_hours': rec.recommended_duration,
-                'justification': rec.justification,
-                'cost_estimate': rec.cost_estimate,
-                'effectiveness_score': rec.effectiveness_score
-            }
+            dict(zip(_RECOMMENDATION_KEYS, _recommendation_values(rec)))
             for rec in recommendations
         ],
         'resource_status': resource_optimizer.get_resource_status_summary(),
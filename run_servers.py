@@ -1,35 +1,50 @@
 
-import subprocess
+import socket
 import sys
 import time
 import threading
+from werkzeug.serving import run_simple
 
-def run_main_server():
-    """Run the main web server for frontend"""
+# All three apps are served from threads of this one process, so NumPy, the ML
+# models and Flask are imported once and share a heap instead of one interpreter each
+
+def serve_app(name, app, port):
+    """Serve a WSGI app on the threaded development server (blocks until the process exits)"""
     try:
-        subprocess.run([sys.executable, 'main_server.py'], check=True)
-    except KeyboardInterrupt:
-        print("Main web server stopped")
+        run_simple('0.0.0.0', port, app, threaded=True)
     except Exception as e:
-        print(f"Error running main server: {e}")
+        print(f"Error running {name}: {e}")
+
+def wait_ready(port, timeout=30):
+    """Poll until a server accepts connections on port, backing off exponentially; False on timeout"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return True
+        except OSError:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+def run_main_server():
+    """Run the main web server for frontend"""
+    from main_server import app
+    serve_app('main server', app, 5000)
 
 def run_ml_api():
     """Run the ML API server"""
-    try:
-        subprocess.run([sys.executable, 'ml_api.py'], check=True)
-    except KeyboardInterrupt:
-        print("ML API server stopped")
-    except Exception as e:
-        print(f"Error running ML API: {e}")
+    from ml_api import app, real_time_predictor
+    real_time_predictor.start_continuous_prediction()
+    serve_app('ML API', app, 5001)
 
 def run_alert_system():
     """Run the Alert System server"""
-    try:
-        subprocess.run([sys.executable, 'alert_system.py'], check=True)
-    except KeyboardInterrupt:
-        print("Alert System server stopped")
-    except Exception as e:
-        print(f"Error running Alert System: {e}")
+    from alert_system import create_alert_app
+    serve_app('Alert System', create_alert_app(), 5002)
 
 def main():
     print("🚀 Starting NeuroNix Forest Fire Prediction System...")
@@ -38,25 +53,32 @@ def main():
     print("📱 Alert System will run on port 5002")
     print("\nPress Ctrl+C to stop all servers\n")
     
-    # Start main web server in a separate thread
-    main_thread = threading.Thread(target=run_main_server, daemon=True)
-    main_thread.start()
-    
-    # Wait a moment before starting other services
-    time.sleep(2)
-    
-    # Start ML API in a separate thread
-    ml_thread = threading.Thread(target=run_ml_api, daemon=True)
-    ml_thread.start()
-    
-    # Wait a moment before starting alert system
-    time.sleep(2)
-    
-    # Start Alert System in a separate thread
-    alert_thread = threading.Thread(target=run_alert_system, daemon=True)
-    alert_thread.start()
-    
     try:
+        # Start main web server in a separate thread
+        main_thread = threading.Thread(target=run_main_server, daemon=True)
+        main_thread.start()
+        
+        # Start the next service once this one accepts connections
+        if not wait_ready(5000):
+            print("⚠️ Main web server not ready after 30s, starting the others anyway")
+        
+        # Start ML API in a separate thread
+        ml_thread = threading.Thread(target=run_ml_api, daemon=True)
+        ml_thread.start()
+        
+        # Start the alert system once the ML API is up
+        if not wait_ready(5001):
+            print("⚠️ ML API not ready after 30s, starting the alert system anyway")
+        
+        # Start Alert System in a separate thread
+        alert_thread = threading.Thread(target=run_alert_system, daemon=True)
+        alert_thread.start()
+        
+        if wait_ready(5002):
+            print("✅ All servers ready")
+        else:
+            print("⚠️ Alert System not ready after 30s")
+        
         # Keep main thread alive
         while True:
             time.sleep(1)
@@ -0,0 +1,31 @@
+
+from setuptools import setup, Extension
+
+# The Cython emission kernel is optional: without Cython the modules install
+# as plain Python and environmental_impact falls back to numba or NumPy
+try:
+    from Cython.Build import cythonize
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+ext_modules = []
+if CYTHON_AVAILABLE:
+    ext_modules = cythonize([
+        Extension(
+            '_impact_kernel',
+            ['_impact_kernel.pyx'],
+            # -fno-finite-math-only keeps NaN weather readings in the last bucket
+            extra_compile_args=['-O3', '-march=native', '-ffast-math', '-fno-finite-math-only', '-fopenmp'],
+            extra_link_args=['-fopenmp']
+        )
+    ])
+
+setup(
+    name='neuronix-forestfire',
+    py_modules=[
+        'alert_system', 'environmental_impact', 'evacuation_routes', 'json_provider',
+        'main_server', 'ml_api', 'ml_models', 'resource_optimizer', 'run_servers', 'wsgi'
+    ],
+    ext_modules=ext_modules
+)
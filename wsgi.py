@@ -0,0 +1,8 @@
+
+"""WSGI entry point for the alert system.
+
+Run with: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+from alert_system import create_alert_app
+
+application = create_alert_app()